@@ -1,9 +1,4 @@
-from solution_2 import Load, AirTicket
+from solution_2 import Load, AirTicket, TicketBoard
 
 tickets = Load.write('tickets.txt')
-print('-' * 79)
-print('|     NAME       |FROM|TO |   DATE/TIME    |       FLIGHT       |SEAT|CLS|GATE|')
-print('=' * 79)
-for item in Load.data:
-    print(item)
-print('-' * 79)
+TicketBoard().render(Load.data)
@@ -1,17 +1,44 @@
+import csv
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
 class Date:
     """
     Represents a date and provides methods for date manipulation and comparison.
 
     Attributes:
         days (dict): A dictionary containing the number of days for each month.
+        month_days (tuple): Immutable month lengths for common and leap years.
         month (dict): A dictionary mapping month numbers to their abbreviated names.
+        cache (DateCache): The shared parse cache, None while caching is disabled.
 
     Methods:
         __init__: Initializes a Date object with a given date string.
+        enable_cache: Class method to turn on the shared parse cache.
+        disable_cache: Class method to turn off the shared parse cache.
         leap_year: Static method to determine if a given year is a leap year.
+        is_leap: Static method to check a leap year without touching shared state.
+        parse: Static method to validate a date string and count days since 1970.
+        diagnose: Static method to validate a date string and explain why it is invalid.
+        validate_many: Static method to validate many date strings without printing.
+        parse_chunk: Static method to parse a list of date strings.
+        parse_many: Class method to parse many date strings in a thread or process pool.
+        parse_array: Static method to parse a column of date strings into NumPy arrays.
         check_date: Instance method to validate the format and correctness of the date string.
         date: Getter property to retrieve the formatted date string.
         date.setter: Setter property to set the date from a given string.
+        days_from_civil: Static method to count days since 1970 for a given day, month and year.
+        civil_from_days: Static method to get the year, month and day for days since 1970.
+        freeze: Instance method to get an immutable hashable copy of the date.
+        from_ordinal: Class method to create a Date object from days since 1970.
+        range: Class method to lazily iterate over the days between two dates.
+        weekday: Instance method to get the day of the week.
+        __add__: Instance method to move the date forward by a number of days.
+        __sub__: Instance method to move the date back by a number of days or count days between two dates.
+        ordinal: Getter property to retrieve the number of days since 1970.
         to_timestamp: Instance method to count time since 1970.
         __eq__: Instance method to check equality between two Date objects.
         __ne__: Instance method to check inequality between two Date objects.
@@ -23,6 +50,8 @@ class Date:
         __repr__: Instance method to return a string representation of the Date object.
     """
     days = {}
+    month_days = ((31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31),
+                  (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31))
     month = {'01': 'янв',
              '02': 'фев',
              '03': 'мар',
@@ -35,6 +64,7 @@ class Date:
              '10': 'окт',
              '11': 'ноя',
              '12': 'дек'}
+    cache = None
 
     def __init__(self, dt):
         """
@@ -44,8 +74,30 @@ class Date:
             dt (str): The date string in the format 'DD.MM.YYYY'.
         """
         self.__date = None
+        self.__ordinal = None
         Date.check_date(self, dt)
 
+    @classmethod
+    def enable_cache(cls, maxsize=4096):
+        """
+        Turn on the shared parse cache.
+
+        Args:
+            maxsize (int, optional): The maximum number of cached strings. Defaults to 4096.
+
+        Returns:
+            DateCache: The new cache.
+        """
+        Date.cache = DateCache(maxsize)
+        return Date.cache
+
+    @classmethod
+    def disable_cache(cls):
+        """
+        Turn off the shared parse cache.
+        """
+        Date.cache = None
+
     @staticmethod
     def leap_year(year):
         """
@@ -57,10 +109,242 @@ class Date:
         Returns:
             dict: A dictionary containing the number of days for each month.
         """
-        if (year % 4 == 0 and year % 100 != 0) or year % 400 == 0:
-            Date.days = {1: 31, 2: 29, 3: 31, 4: 30, 5: 31, 6: 30, 7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31}
+        Date.days = dict(enumerate(Date.month_days[Date.is_leap(year)], 1))
+
+    @staticmethod
+    def is_leap(year):
+        """
+        Check if a given year is a leap year.
+
+        Args:
+            year (int): The year to be checked.
+
+        Returns:
+            bool: True for a leap year, False otherwise.
+        """
+        return (year % 4 == 0 and year % 100 != 0) or year % 400 == 0
+
+    @staticmethod
+    def days_from_civil(year, month, day):
+        """
+        Count days since 01.01.1970 in constant time.
+
+        Args:
+            year (int): The year.
+            month (int): The month.
+            day (int): The day of the month.
+
+        Returns:
+            int: days from 1970, negative for earlier dates.
+        """
+        year -= month <= 2
+        era = year // 400
+        yoe = year - era * 400
+        doy = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+        doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+        return era * 146097 + doe - 719468
+
+    @staticmethod
+    def civil_from_days(ordinal):
+        """
+        Get the year, month and day for a number of days since 01.01.1970.
+
+        Args:
+            ordinal (int): days from 1970.
+
+        Returns:
+            tuple: The year, month and day.
+        """
+        ordinal += 719468
+        era = ordinal // 146097
+        doe = ordinal - era * 146097
+        yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+        doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+        mp = (5 * doy + 2) // 153
+        day = doy - (153 * mp + 2) // 5 + 1
+        month = mp + 3 if mp < 10 else mp - 9
+        return yoe + era * 400 + (month <= 2), month, day
+
+    @staticmethod
+    def parse(value):
+        """
+        Validate a date string and count days since 1970.
+
+        Reads only the immutable month_days table, so it is safe to call from many threads at once.
+
+        Args:
+            value (str): The date string in the format 'DD.MM.YYYY'.
+
+        Returns:
+            int: days from 1970, None if the string is not a valid date.
+        """
+        return Date.diagnose(value)[0]
+
+    @staticmethod
+    def diagnose(value):
+        """
+        Validate a date string and explain why it is invalid.
+
+        Args:
+            value (str): The date string in the format 'DD.MM.YYYY'.
+
+        Returns:
+            tuple: days from 1970 and None, or None and the reason the string is invalid.
+        """
+        if not isinstance(value, str):
+            return None, 'not a string'
+        new_value = value.split('.')
+        if len(new_value) != 3:
+            return None, 'wrong format'
+        day, month, year = new_value
+        if len(day) != 2 or len(month) != 2 or len(year) != 4:
+            return None, 'wrong format'
+        digits = day + month + year
+        if not (digits.isascii() and digits.isdigit()):
+            return None, 'wrong format'
+        day = int(day)
+        month = int(month)
+        year = int(year)
+        if year <= 0:
+            return None, 'wrong year'
+        if not 1 <= month <= 12:
+            return None, 'wrong month'
+        if day <= 0 or Date.month_days[Date.is_leap(year)][month - 1] < day:
+            return None, 'wrong day'
+        return Date.days_from_civil(year, month, day), None
+
+    @staticmethod
+    def validate_many(values, rejects=None, max_errors=None):
+        """
+        Validate many date strings quietly and collect the failures.
+
+        Args:
+            values (iterable): The date strings to be validated.
+            rejects (str, optional): The path of a file to write the rejected rows to. Defaults to None.
+            max_errors (int, optional): The maximum number of failures kept in the report. Defaults to no limit.
+
+        Returns:
+            ValidationReport: The days from 1970 for every row and the collected failures.
+        """
+        report = ValidationReport(max_errors)
+        for value in values:
+            report.add(value, *Date.diagnose(value))
+        if rejects is not None:
+            report.write_rejects(rejects)
+        return report
+
+    @staticmethod
+    def parse_chunk(values):
+        """
+        Parse a list of date strings.
+
+        Args:
+            values (list): The date strings to be parsed.
+
+        Returns:
+            list: days from 1970 for every string, None for invalid ones.
+        """
+        return [Date.parse(value) for value in values]
+
+    @classmethod
+    def parse_many(cls, strings, workers=None, processes=False):
+        """
+        Parse many date strings in a thread or process pool.
+
+        Invalid strings give Date objects with ordinal None without printing a message.
+        Use validate_many to get the reasons.
+
+        Args:
+            strings (iterable): The date strings in the format 'DD.MM.YYYY'.
+            workers (int, optional): The number of workers. Defaults to the number of CPUs.
+            processes (bool, optional): Use processes instead of threads. Defaults to False.
+
+        Returns:
+            list: Date objects in the order of the input strings.
+        """
+        strings = list(strings)
+        workers = workers or os.cpu_count() or 1
+        if workers <= 1 or len(strings) < 2 * workers:
+            ordinals = Date.parse_chunk(strings)
         else:
-            Date.days = {1: 31, 2: 28, 3: 31, 4: 30, 5: 31, 6: 30, 7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31}
+            size = -(-len(strings) // (workers * 4))
+            chunks = [strings[i:i + size] for i in range(0, len(strings), size)]
+            pool = ProcessPoolExecutor if processes else ThreadPoolExecutor
+            with pool(max_workers=workers) as executor:
+                ordinals = [ordinal for part in executor.map(Date.parse_chunk, chunks) for ordinal in part]
+        return [cls._from_parsed(value, ordinal) for value, ordinal in zip(strings, ordinals)]
+
+    @staticmethod
+    def parse_array(strings, datetime64=False, chunk_size=1 << 20):
+        """
+        Parse a column of date strings into NumPy arrays without creating Date objects.
+
+        Requires NumPy. Validation, leap years and day counting run as array operations
+        over chunks of chunk_size strings.
+
+        Args:
+            strings (sequence): The date strings in the format 'DD.MM.YYYY'.
+            datetime64 (bool, optional): Return datetime64[D] values instead of int32 days. Defaults to False.
+            chunk_size (int, optional): The number of strings converted at once. Defaults to 1048576.
+
+        Returns:
+            tuple: The days from 1970 (0 or NaT for invalid strings) and a boolean validity mask.
+        """
+        import numpy as np
+
+        total = len(strings)
+        ordinals = np.zeros(total, dtype=np.int32)
+        valid = np.zeros(total, dtype=bool)
+        table = np.array(Date.month_days, dtype=np.int32)
+        for start in range(0, total, chunk_size):
+            values = np.asarray(strings[start:start + chunk_size], dtype=str).ravel()
+            ok = np.char.str_len(values) == 10
+            codes = np.where(ok, values, '00.00.0000').astype('<U10').view(np.uint32).reshape(-1, 10)
+            codes = codes.astype(np.int32) - 48
+            digits = codes[:, [0, 1, 3, 4, 6, 7, 8, 9]]
+            ok &= ((digits >= 0) & (digits <= 9)).all(axis=1)
+            ok &= (codes[:, 2] == ord('.') - 48) & (codes[:, 5] == ord('.') - 48)
+            day = codes[:, 0] * 10 + codes[:, 1]
+            month = codes[:, 3] * 10 + codes[:, 4]
+            year = codes[:, 6] * 1000 + codes[:, 7] * 100 + codes[:, 8] * 10 + codes[:, 9]
+            leap = ((year % 4 == 0) & (year % 100 != 0)) | (year % 400 == 0)
+            ok &= (day >= 1) & (month >= 1) & (month <= 12) & (year >= 1)
+            ok &= day <= table[leap.astype(np.intp), np.clip(month, 1, 12) - 1]
+            year = year - (month <= 2)
+            era = year // 400
+            yoe = year - era * 400
+            doy = (153 * np.where(month > 2, month - 3, month + 9) + 2) // 5 + day - 1
+            doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+            end = start + len(values)
+            ordinals[start:end] = np.where(ok, era * 146097 + doe - 719468, 0)
+            valid[start:end] = ok
+        if datetime64:
+            dates = ordinals.astype('datetime64[D]')
+            dates[~valid] = np.datetime64('NaT')
+            return dates, valid
+        return ordinals, valid
+
+    @classmethod
+    def _from_parsed(cls, value, ordinal):
+        """
+        Create a Date object from an already validated string.
+
+        Unlike check_date, an invalid date is not reported with a message, so bulk paths
+        do not write to stdout once per row.
+
+        Args:
+            value (str): The date string.
+            ordinal (int): days from 1970, None for an invalid date.
+
+        Returns:
+            Date: The new Date object.
+        """
+        dt = cls.__new__(cls)
+        if ordinal is None:
+            value = None
+        dt.__date = value
+        dt.__ordinal = ordinal
+        return dt
 
     def check_date(self, value):
         """
@@ -69,31 +353,18 @@ class Date:
         Args:
             value (str): The date string to be validated.
         """
-        if not isinstance(value, str):
+        cache = Date.cache
+        if cache is not None and isinstance(value, str):
+            frozen = cache.lookup(value)
+            ordinal = None if frozen is None else frozen.ordinal
+        else:
+            ordinal = Date.parse(value)
+        if ordinal is None:
             print('ошибка')
             self.__date = None
         else:
-            new_value = value.split('.')
-            if len(new_value) > 3:
-                print('ошибка')
-                self.__date = None
-            day = new_value[0]
-            month = new_value[1]
-            year = new_value[2]
-            if len(day) != 2 or len(month) != 2 or len(year) != 4 or any(
-                    int(i) <= 0 for i in [day, month, year]):
-                print('ошибка')
-                self.__date = None
-            else:
-                day = int(day)
-                month = int(month)
-                year = int(year)
-                Date.leap_year(year)
-                if month not in Date.days or Date.days[month] < day:
-                    print('ошибка')
-                    self.__date = None
-                else:
-                    self.__date = value
+            self.__date = value
+        self.__ordinal = ordinal
 
     @property
     def date(self):
@@ -118,6 +389,16 @@ class Date:
         """
         Date.check_date(self, new_dt)
 
+    @property
+    def ordinal(self):
+        """
+        Get the number of days since 1970.
+
+        Returns:
+            int: days from 1970, None for an invalid date.
+        """
+        return self.__ordinal
+
     def to_timestamp(self):
         """
         Count time since 1970.
@@ -125,20 +406,91 @@ class Date:
         Returns:
             int: seconds from 1970.
         """
-        dt = self.__date.split('.')
-        day = int(dt[0])
-        month = int(dt[1])
-        year = int(dt[2])
-        Date.leap_year(year)
-        sec_day = 86400
-        sec = (day - 1) * sec_day
-        for i in range(1, month):
-            sec += Date.days[i] * sec_day
-        for j in range(1970, year):
-            Date.leap_year(j)
-            for i in range(1, 13):
-                sec += Date.days[i] * sec_day
-        return sec
+        return self.__ordinal * 86400
+
+    def freeze(self):
+        """
+        Get an immutable hashable copy of the date.
+
+        Returns:
+            FrozenDate: The frozen date, None for an invalid date.
+        """
+        if self.__ordinal is None:
+            return None
+        return FrozenDate(self.__ordinal)
+
+    @classmethod
+    def from_ordinal(cls, ordinal):
+        """
+        Create a Date object from days since 1970.
+
+        Args:
+            ordinal (int): days from 1970.
+
+        Returns:
+            Date: The new Date object.
+        """
+        year, month, day = Date.civil_from_days(ordinal)
+        if not 1 <= year <= 9999:
+            return cls._from_parsed(None, None)
+        return cls._from_parsed(f'{day:02d}.{month:02d}.{year:04d}', ordinal)
+
+    @classmethod
+    def range(cls, start, stop, step=1):
+        """
+        Lazily iterate over the days from start up to, but not including, stop.
+
+        Args:
+            start (Date): The first date.
+            stop (Date): The date to stop before.
+            step (int, optional): The number of days between two dates. Defaults to 1.
+
+        Yields:
+            Date: The next date.
+        """
+        for ordinal in range(start.ordinal, stop.ordinal, step):
+            yield cls.from_ordinal(ordinal)
+
+    def weekday(self):
+        """
+        Get the day of the week.
+
+        Returns:
+            int: 0 for Monday through 6 for Sunday.
+        """
+        return (self.__ordinal + 3) % 7
+
+    def __add__(self, days):
+        """
+        Move the date forward by a number of days.
+
+        Args:
+            days (int): The number of days.
+
+        Returns:
+            Date: The new Date object.
+        """
+        if not isinstance(days, int):
+            return NotImplemented
+        return Date.from_ordinal(self.__ordinal + days)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """
+        Move the date back by a number of days or count days between two dates.
+
+        Args:
+            other (int or Date): The number of days or the date to subtract.
+
+        Returns:
+            Date or int: The new Date object, or the number of days between the dates.
+        """
+        if isinstance(other, int):
+            return Date.from_ordinal(self.__ordinal - other)
+        if hasattr(other, 'ordinal'):
+            return self.__ordinal - other.ordinal
+        return NotImplemented
 
     def __eq__(self, other):
         """
@@ -150,7 +502,7 @@ class Date:
         Returns:
             bool: True if the Date objects are equal, False otherwise.
         """
-        return Date.to_timestamp(self) == Date.to_timestamp(other)
+        return self.ordinal == other.ordinal
 
     def __ne__(self, other):
         """
@@ -162,7 +514,7 @@ class Date:
         Returns:
             bool: True if the Date objects are not equal, False otherwise.
         """
-        return Date.to_timestamp(self) != Date.to_timestamp(other)
+        return self.ordinal != other.ordinal
 
     def __lt__(self, other):
         """
@@ -174,7 +526,7 @@ class Date:
         Returns:
             bool: True if the first Date object is less than the second, False otherwise.
         """
-        return Date.to_timestamp(self) < Date.to_timestamp(other)
+        return self.ordinal < other.ordinal
 
     def __le__(self, other):
         """
@@ -186,7 +538,7 @@ class Date:
         Returns:
             bool: True if the first Date object is less than or equal to the second, False otherwise.
         """
-        return Date.to_timestamp(self) <= Date.to_timestamp(other)
+        return self.ordinal <= other.ordinal
 
     def __gt__(self, other):
         """
@@ -198,7 +550,7 @@ class Date:
         Returns:
             bool: True if the first Date object is greater than the second, False otherwise.
         """
-        return Date.to_timestamp(self) > Date.to_timestamp(other)
+        return self.ordinal > other.ordinal
 
     def __ge__(self, other):
         """
@@ -210,7 +562,7 @@ class Date:
         Returns:
             bool: True if the first Date object is greater than or equal to the second, False otherwise.
         """
-        return Date.to_timestamp(self) >= Date.to_timestamp(other)
+        return self.ordinal >= other.ordinal
 
     def __str__(self):
         """
@@ -233,3 +585,467 @@ class Date:
         if self.__date is None:
             return 'None'
         return self.__date
+
+
+class FrozenDate:
+    """
+    Represents an immutable hashable date stored as a single number of days since 1970.
+
+    Attributes:
+        ordinal (int): The number of days since 01.01.1970.
+        min_ordinal (int): The number of days since 1970 of 01.01.0001, the first supported date.
+        max_ordinal (int): The number of days since 1970 of 31.12.9999, the last supported date.
+
+    Methods:
+        __init__: Initializes a FrozenDate object with a given number of days since 1970.
+        from_string: Class method to create a FrozenDate object from a date string.
+        intern: Class method to get a shared FrozenDate object for a date string.
+        date: Getter property to retrieve the formatted date string.
+        to_timestamp: Instance method to count time since 1970.
+        weekday: Instance method to get the day of the week.
+        __add__: Instance method to move the date forward by a number of days.
+        __sub__: Instance method to move the date back by a number of days or count days between two dates.
+        __eq__, __ne__, __lt__, __le__, __gt__, __ge__: Instance methods to compare dates.
+        __hash__: Instance method to return the hash of the date.
+        __str__: Instance method to return the date in the format 'DD.MM.YYYY'.
+        __repr__: Instance method to return the date in the format 'DD.MM.YYYY'.
+    """
+    __slots__ = ('ordinal',)
+    min_ordinal = Date.days_from_civil(1, 1, 1)
+    max_ordinal = Date.days_from_civil(9999, 12, 31)
+
+    def __init__(self, ordinal):
+        """
+        Initializes a FrozenDate object with a given number of days since 1970.
+
+        Args:
+            ordinal (int): days from 1970.
+
+        Raises:
+            ValueError: If the date is outside the years 1 to 9999, like Date.from_ordinal.
+        """
+        if not FrozenDate.min_ordinal <= ordinal <= FrozenDate.max_ordinal:
+            raise ValueError('FrozenDate is outside the years 1 to 9999')
+        object.__setattr__(self, 'ordinal', ordinal)
+
+    @classmethod
+    def from_string(cls, value):
+        """
+        Create a FrozenDate object from a date string.
+
+        Args:
+            value (str): The date string in the format 'DD.MM.YYYY'.
+
+        Returns:
+            FrozenDate: The new FrozenDate object, None for an invalid date.
+        """
+        ordinal = Date.parse(value)
+        if ordinal is None:
+            return None
+        return cls(ordinal)
+
+    @classmethod
+    def intern(cls, value):
+        """
+        Get a shared FrozenDate object for a date string through Date.cache.
+
+        Args:
+            value (str): The date string in the format 'DD.MM.YYYY'.
+
+        Returns:
+            FrozenDate: The shared FrozenDate object, None for an invalid date.
+        """
+        if Date.cache is None:
+            return cls.from_string(value)
+        return Date.cache.lookup(value)
+
+    def __setattr__(self, name, value):
+        """
+        Forbid changing attributes of the FrozenDate object.
+
+        Args:
+            name (str): The attribute name.
+            value: The new attribute value.
+
+        Raises:
+            AttributeError: Always, FrozenDate is immutable.
+        """
+        raise AttributeError('FrozenDate is immutable')
+
+    def __delattr__(self, name):
+        """
+        Forbid deleting attributes of the FrozenDate object.
+
+        Args:
+            name (str): The attribute name.
+
+        Raises:
+            AttributeError: Always, FrozenDate is immutable.
+        """
+        raise AttributeError('FrozenDate is immutable')
+
+    def __reduce__(self):
+        """
+        Support pickling, which cannot set attributes of an immutable object.
+
+        Returns:
+            tuple: The class and the ordinal to rebuild the FrozenDate object with.
+        """
+        return FrozenDate, (self.ordinal,)
+
+    @property
+    def date(self):
+        """
+        Get the formatted date string.
+
+        Returns:
+            str: The formatted date string.
+        """
+        year, month, day = Date.civil_from_days(self.ordinal)
+        return f'{day:02d} {Date.month[f"{month:02d}"]} {year:04d}г.'
+
+    def to_timestamp(self):
+        """
+        Count time since 1970.
+
+        Returns:
+            int: seconds from 1970.
+        """
+        return self.ordinal * 86400
+
+    def weekday(self):
+        """
+        Get the day of the week.
+
+        Returns:
+            int: 0 for Monday through 6 for Sunday.
+        """
+        return (self.ordinal + 3) % 7
+
+    def __add__(self, days):
+        """
+        Add days to the FrozenDate object.
+
+        Args:
+            days (int): The number of days to add.
+
+        Returns:
+            FrozenDate: The new FrozenDate object.
+
+        Raises:
+            ValueError: If the new date is outside the years 1 to 9999.
+        """
+        if not isinstance(days, int):
+            return NotImplemented
+        return FrozenDate(self.ordinal + days)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """
+        Subtract days or another date from the FrozenDate object.
+
+        Args:
+            other (int or Date or FrozenDate): The number of days or the date to subtract.
+
+        Returns:
+            FrozenDate or int: The new FrozenDate object for days, the number of days between the dates
+            for a date.
+
+        Raises:
+            ValueError: If the new date is outside the years 1 to 9999.
+        """
+        if isinstance(other, int):
+            return FrozenDate(self.ordinal - other)
+        if hasattr(other, 'ordinal'):
+            return self.ordinal - other.ordinal
+        return NotImplemented
+
+    def __eq__(self, other):
+        """
+        Check equality between the FrozenDate object and another date.
+
+        Args:
+            other (Date or FrozenDate): The date to compare with.
+
+        Returns:
+            bool: True if the dates are equal, False otherwise,
+            NotImplemented for other objects.
+        """
+        if not hasattr(other, 'ordinal'):
+            return NotImplemented
+        return self.ordinal == other.ordinal
+
+    def __ne__(self, other):
+        """
+        Check inequality between the FrozenDate object and another date.
+
+        Args:
+            other (Date or FrozenDate): The date to compare with.
+
+        Returns:
+            bool: True if the dates are not equal, False otherwise,
+            NotImplemented for other objects.
+        """
+        if not hasattr(other, 'ordinal'):
+            return NotImplemented
+        return self.ordinal != other.ordinal
+
+    def __lt__(self, other):
+        """
+        Check if this date is less than another date.
+
+        Args:
+            other (Date or FrozenDate): The date to compare with.
+
+        Returns:
+            bool: True if this date is less than the other, False otherwise,
+            NotImplemented for other objects.
+        """
+        if not hasattr(other, 'ordinal'):
+            return NotImplemented
+        return self.ordinal < other.ordinal
+
+    def __le__(self, other):
+        """
+        Check if this date is less than or equal to another date.
+
+        Args:
+            other (Date or FrozenDate): The date to compare with.
+
+        Returns:
+            bool: True if this date is less than or equal to the other, False otherwise,
+            NotImplemented for other objects.
+        """
+        if not hasattr(other, 'ordinal'):
+            return NotImplemented
+        return self.ordinal <= other.ordinal
+
+    def __gt__(self, other):
+        """
+        Check if this date is greater than another date.
+
+        Args:
+            other (Date or FrozenDate): The date to compare with.
+
+        Returns:
+            bool: True if this date is greater than the other, False otherwise,
+            NotImplemented for other objects.
+        """
+        if not hasattr(other, 'ordinal'):
+            return NotImplemented
+        return self.ordinal > other.ordinal
+
+    def __ge__(self, other):
+        """
+        Check if this date is greater than or equal to another date.
+
+        Args:
+            other (Date or FrozenDate): The date to compare with.
+
+        Returns:
+            bool: True if this date is greater than or equal to the other, False otherwise,
+            NotImplemented for other objects.
+        """
+        if not hasattr(other, 'ordinal'):
+            return NotImplemented
+        return self.ordinal >= other.ordinal
+
+    def __hash__(self):
+        """
+        Hash the FrozenDate object by its ordinal, so it can be used in sets and as a dictionary key.
+
+        Returns:
+            int: The hash value.
+        """
+        return hash(self.ordinal)
+
+    def __str__(self):
+        """
+        Return the date in the format 'DD.MM.YYYY'.
+
+        Returns:
+            str: The string representation of the FrozenDate object.
+        """
+        year, month, day = Date.civil_from_days(self.ordinal)
+        return f'{day:02d}.{month:02d}.{year:04d}'
+
+    def __repr__(self):
+        """
+        Return the date in the format 'DD.MM.YYYY'.
+
+        Returns:
+            str: The string representation of the FrozenDate object.
+        """
+        return FrozenDate.__str__(self)
+
+
+class DateCache:
+    """
+    Represents a bounded LRU cache of parsed date strings.
+
+    Attributes:
+        maxsize (int): The maximum number of cached strings.
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups that had to parse the string.
+        evictions (int): The number of strings dropped to keep the cache bounded.
+
+    Methods:
+        __init__: Initializes an empty DateCache object.
+        lookup: Instance method to get the shared FrozenDate object for a date string.
+        info: Instance method to get the cache counters.
+        clear: Instance method to drop all cached strings and reset the counters.
+        __len__: Instance method to return the number of cached strings.
+    """
+
+    def __init__(self, maxsize=4096):
+        """
+        Initializes an empty DateCache object.
+
+        Args:
+            maxsize (int, optional): The maximum number of cached strings. Defaults to 4096.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.__items = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def lookup(self, value):
+        """
+        Get the shared FrozenDate object for a date string.
+
+        Args:
+            value (str): The date string in the format 'DD.MM.YYYY'.
+
+        Returns:
+            FrozenDate: The shared FrozenDate object, None for an invalid date.
+        """
+        with self.__lock:
+            if value in self.__items:
+                self.hits += 1
+                self.__items.move_to_end(value)
+                return self.__items[value]
+            self.misses += 1
+        frozen = FrozenDate.from_string(value)
+        with self.__lock:
+            self.__items[value] = frozen
+            if len(self.__items) > self.maxsize:
+                self.__items.popitem(last=False)
+                self.evictions += 1
+        return frozen
+
+    def info(self):
+        """
+        Get the cache counters.
+
+        Returns:
+            dict: The hits, misses, evictions, current size and maximum size.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'size': len(self.__items), 'maxsize': self.maxsize}
+
+    def clear(self):
+        """
+        Drop all cached strings and reset the counters.
+        """
+        with self.__lock:
+            self.__items.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        """
+        Return the number of cached strings.
+
+        Returns:
+            int: The number of cached strings.
+        """
+        return len(self.__items)
+
+
+class ValidationReport:
+    """
+    Represents the result of a quiet bulk validation of date strings.
+
+    Attributes:
+        ordinals (list): The days from 1970 for every row, None for invalid rows.
+        errors (list): The (row index, raw value, reason) tuples of invalid rows.
+        reasons (dict): The number of invalid rows for every reason.
+        total (int): The number of validated rows.
+        invalid (int): The number of invalid rows.
+        max_errors (int): The maximum number of kept errors, None for no limit.
+
+    Methods:
+        __init__: Initializes an empty ValidationReport object.
+        add: Instance method to record the result for the next row.
+        valid: Getter property to retrieve the number of valid rows.
+        write_rejects: Instance method to write the invalid rows to a file.
+        __str__: Instance method to return a short summary of the report.
+    """
+
+    def __init__(self, max_errors=None):
+        """
+        Initializes an empty ValidationReport object.
+
+        Args:
+            max_errors (int, optional): The maximum number of kept errors. Defaults to no limit.
+        """
+        self.ordinals = []
+        self.errors = []
+        self.reasons = {}
+        self.total = 0
+        self.invalid = 0
+        self.max_errors = max_errors
+
+    def add(self, value, ordinal, reason):
+        """
+        Record the result for the next row.
+
+        Args:
+            value: The raw value of the row.
+            ordinal (int): days from 1970, None for an invalid row.
+            reason (str): The reason the row is invalid, None for a valid row.
+        """
+        self.ordinals.append(ordinal)
+        if reason is not None:
+            self.invalid += 1
+            self.reasons[reason] = self.reasons.get(reason, 0) + 1
+            if self.max_errors is None or len(self.errors) < self.max_errors:
+                self.errors.append((self.total, value, reason))
+        self.total += 1
+
+    @property
+    def valid(self):
+        """
+        Get the number of valid rows.
+
+        Returns:
+            int: The number of valid rows.
+        """
+        return self.total - self.invalid
+
+    def write_rejects(self, file):
+        """
+        Write the kept invalid rows to a file in one buffered write.
+
+        Every line has the format 'index;raw value;reason'. Values with ';', quotes or line breaks are quoted
+        by the csv module, so every rejected row stays on one record.
+
+        Args:
+            file (str): The path to the rejects file.
+        """
+        with open(file, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f, delimiter=';', lineterminator='\n')
+            writer.writerow(('index', 'value', 'reason'))
+            writer.writerows(self.errors)
+
+    def __str__(self):
+        """
+        Return a short summary of the report.
+
+        Returns:
+            str: The number of rows, valid and invalid rows and the reasons.
+        """
+        reasons = ', '.join(f'{reason}: {count}' for reason, count in self.reasons.items())
+        return f'total: {self.total} valid: {self.valid} invalid: {self.invalid} ({reasons})'
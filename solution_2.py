@@ -1,50 +1,670 @@
+import asyncio
+import hashlib
+import heapq
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter, namedtuple
+from collections.abc import MutableSequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import islice
+
+from solution_1 import Date
+
+FileResult = namedtuple('FileResult', ('path', 'seconds', 'rows', 'error'))
+
+
+class EncodedColumn:
+    """
+    Represents a dictionary-encoded column of repeating strings.
+
+    Every distinct value is stored once in a shared value table, and every row only keeps
+    a small integer code. The code array starts with one byte per row and is widened
+    when more distinct values appear. The column behaves like a read-and-append list of strings.
+
+    Attributes:
+        values (list): The distinct values in order of first appearance.
+        lookup (dict): The code of every distinct value.
+        codes (array): The code of every row.
+
+    Methods:
+        __init__: Initializes an empty EncodedColumn object.
+        code: Returns the code of a value, adding it to the value table if needed.
+        append: Adds a value to the end of the column.
+        extend: Adds many values to the end of the column.
+        load: Replaces the content of the column with a value table and codes.
+        counts: Returns the number of rows for every distinct value.
+        index: Returns the first row with a given value.
+        __len__: Returns the number of rows.
+        __getitem__: Returns the value of a row or a list of values for a slice.
+        __iter__: Iterates over the values of the rows.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty EncodedColumn object.
+        """
+        self.values = []
+        self.lookup = {}
+        self.codes = array('B')
+
+    def code(self, value):
+        """
+        Returns the code of a value, adding it to the value table if needed.
+
+        Args:
+            value (str): The value.
+
+        Returns:
+            int: The code of the value.
+        """
+        code = self.lookup.get(value)
+        if code is None:
+            code = len(self.values)
+            if code == 0x100 or code == 0x10000:
+                self.codes = array('H' if code == 0x100 else 'I', self.codes)
+            self.values.append(value)
+            self.lookup[value] = code
+        return code
+
+    def append(self, value):
+        """
+        Adds a value to the end of the column.
+
+        Args:
+            value (str): The value.
+        """
+        code = self.code(value)
+        self.codes.append(code)
+
+    def extend(self, values):
+        """
+        Adds many values to the end of the column.
+
+        Another EncodedColumn is merged by translating its value table once. If the codes
+        do not change, as for an empty column, the code array is copied as a whole.
+
+        Args:
+            values (iterable): The values.
+        """
+        if isinstance(values, EncodedColumn):
+            mapping = [self.code(value) for value in values.values]
+            if mapping != list(range(len(mapping))):
+                self.codes.extend(map(mapping.__getitem__, values.codes))
+            elif values.codes.typecode == self.codes.typecode:
+                self.codes.extend(values.codes)
+            else:
+                self.codes.extend(array(self.codes.typecode, values.codes))
+        else:
+            for value in values:
+                self.append(value)
+
+    def load(self, values, codes):
+        """
+        Replaces the content of the column with a value table and codes.
+
+        Args:
+            values (list): The distinct values.
+            codes (array): The code of every row.
+        """
+        self.values = values
+        self.lookup = {value: code for code, value in enumerate(values)}
+        self.codes = codes
+
+    def counts(self):
+        """
+        Returns the number of rows for every distinct value, counted on the codes.
+
+        Returns:
+            dict: The number of rows for every value.
+        """
+        return {self.values[code]: count for code, count in Counter(self.codes).items()}
+
+    def index(self, value):
+        """
+        Returns the first row with a given value.
+
+        Args:
+            value (str): The value.
+
+        Returns:
+            int: The id of the row.
+        """
+        if value not in self.lookup:
+            raise ValueError(f'{value!r} is not in column')
+        return self.codes.index(self.lookup[value])
+
+    def __len__(self):
+        """
+        Returns the number of rows.
+
+        Returns:
+            int: The number of rows.
+        """
+        return len(self.codes)
+
+    def __getitem__(self, ind):
+        """
+        Returns the value of a row or a list of values for a slice.
+
+        Args:
+            ind (int or slice): The id of the row or a slice of rows.
+
+        Returns:
+            str or list: The value or values.
+        """
+        if isinstance(ind, slice):
+            return list(map(self.values.__getitem__, self.codes[ind]))
+        return self.values[self.codes[ind]]
+
+    def __iter__(self):
+        """
+        Iterates over the values of the rows.
+
+        Returns:
+            iterator: The values of the rows.
+        """
+        return map(self.values.__getitem__, self.codes)
+
+
+class TicketTable:
+    """
+    Represents a columnar table of air tickets.
+
+    Attributes:
+        fields (tuple): The names of the columns.
+        widths (tuple): The widths of the columns in the formatted table.
+        passenger_name (list): A list containing passenger names.
+        _from (EncodedColumn): A column containing departure locations.
+        to (EncodedColumn): A column containing destination locations.
+        date_time (EncodedColumn): A column containing departure date and time.
+        flight (EncodedColumn): A column containing flight numbers.
+        seat (EncodedColumn): A column containing seat numbers.
+        _class (EncodedColumn): A column containing ticket classes.
+        gate (EncodedColumn): A column containing gate numbers.
+        keys (dict): The columns behind every indexable key.
+        indexes (dict): The built hash indexes from key values to row ids.
+        no_time (int): The departure time stored for a date/time that cannot be parsed.
+
+    Methods:
+        __init__: Initializes an empty TicketTable object.
+        append: Adds a row to the table.
+        extend: Adds all rows of another table.
+        row: Returns the values of a row.
+        key_value: Static method to return the value of a key for a row.
+        index: Returns the hash index for a key, building it on first use.
+        count_by: Returns the number of rows for every value of a key.
+        select: Returns a view of the rows matching all given key values.
+        parse_departure: Static method to convert a 'MM/DD/YYYY HH:MM' string to seconds since 1970.
+        departures: Returns the departure time of every row in seconds since 1970.
+        departure_order: Returns the row ids and departure times sorted by departure time.
+        departures_between: Returns a view of the rows departing in a time window.
+        next_departures: Returns a view of the first rows departing at or after a given time.
+        merge_departures: Static method to merge the rows of several tables by departure time.
+        format_row: Returns a formatted string representation of a row.
+        __len__: Returns the number of rows.
+    """
+    fields = ('passenger_name', '_from', 'to', 'date_time', 'flight', 'seat', '_class', 'gate')
+    widths = (16, 4, 3, 16, 20, 4, 3, 4)
+    keys = {'origin': (1,), 'destination': (2,), 'flight': (4,), 'cls': (6,), 'gate': (7,), 'route': (1, 2)}
+    no_time = -1 << 63
+
+    def __init__(self):
+        """
+        Initializes an empty TicketTable object.
+        """
+        self.passenger_name = []
+        self._from = EncodedColumn()
+        self.to = EncodedColumn()
+        self.date_time = EncodedColumn()
+        self.flight = EncodedColumn()
+        self.seat = EncodedColumn()
+        self._class = EncodedColumn()
+        self.gate = EncodedColumn()
+        self.columns = (self.passenger_name, self._from, self.to, self.date_time,
+                        self.flight, self.seat, self._class, self.gate)
+        self.indexes = {}
+        self.__departures = array('q')
+        self.__order = None
+
+    def append(self, values):
+        """
+        Adds a row to the table.
+
+        Args:
+            values (tuple): The values of the row in the order of TicketTable.fields.
+
+        Returns:
+            int: The id of the new row.
+        """
+        for column, value in zip(self.columns, values):
+            column.append(value)
+        ind = len(self.passenger_name) - 1
+        for key, index in self.indexes.items():
+            index.setdefault(TicketTable.key_value(key, values), []).append(ind)
+        return ind
+
+    def extend(self, other):
+        """
+        Adds all rows of another table.
+
+        Args:
+            other (TicketTable): The table to copy the rows from.
+
+        Returns:
+            range: The ids of the new rows.
+        """
+        start = len(self)
+        for column, values in zip(self.columns, other.columns):
+            column.extend(values)
+        self.indexes.clear()
+        return range(start, len(self))
+
+    @staticmethod
+    def key_value(key, values):
+        """
+        Returns the value of a key for a row.
+
+        Args:
+            key (str): The key, one of TicketTable.keys.
+            values (tuple): The values of the row.
+
+        Returns:
+            str or tuple: The value of a single column, or a tuple for the route key.
+        """
+        positions = TicketTable.keys[key]
+        if len(positions) == 1:
+            return values[positions[0]]
+        return tuple(values[pos] for pos in positions)
+
+    def index(self, key):
+        """
+        Returns the hash index for a key, building it on first use.
+
+        The index is kept up to date by append afterwards.
+
+        Args:
+            key (str): The key, one of TicketTable.keys.
+
+        Returns:
+            dict: The row ids for every value of the key.
+        """
+        if key not in self.indexes:
+            if key not in TicketTable.keys:
+                raise KeyError(f'unknown ticket key: {key}')
+            columns = [self.columns[pos] for pos in TicketTable.keys[key]]
+            groups = {}
+            codes = columns[0].codes if len(columns) == 1 else zip(*(column.codes for column in columns))
+            for ind, code in enumerate(codes):
+                groups.setdefault(code, []).append(ind)
+            if len(columns) == 1:
+                self.indexes[key] = {columns[0].values[code]: rows for code, rows in groups.items()}
+            else:
+                self.indexes[key] = {tuple(column.values[c] for column, c in zip(columns, code)): rows
+                                     for code, rows in groups.items()}
+        return self.indexes[key]
+
+    def count_by(self, key):
+        """
+        Returns the number of rows for every value of a key, counted on the integer codes.
+
+        Args:
+            key (str): The key, one of TicketTable.keys.
+
+        Returns:
+            dict: The number of rows for every value of the key.
+        """
+        columns = [self.columns[pos] for pos in TicketTable.keys[key]]
+        if len(columns) == 1:
+            return columns[0].counts()
+        counts = Counter(zip(*(column.codes for column in columns)))
+        return {tuple(column.values[c] for column, c in zip(columns, code)): count
+                for code, count in counts.items()}
+
+    def select(self, **predicates):
+        """
+        Returns a view of the rows matching all given key values.
+
+        Every predicate is answered from its index and the row ids are intersected,
+        starting from the shortest list. A single predicate gets a tuple snapshot of its index list,
+        so the view neither grows with the table nor lets callers change the index.
+
+        Args:
+            **predicates: The wanted values, e.g. flight='EasyJet 1048', gate='27' or route=('EMA', 'LCW').
+
+        Returns:
+            TicketView: The matching rows in table order.
+        """
+        if not predicates:
+            return TicketView(self, range(len(self)))
+        matches = sorted((self.index(key).get(value, []) for key, value in predicates.items()), key=len)
+        if len(matches) == 1:
+            return TicketView(self, tuple(matches[0]))
+        others = [set(rows) for rows in matches[1:]]
+        return TicketView(self, [ind for ind in matches[0] if all(ind in rows for rows in others)])
+
+    @staticmethod
+    def parse_departure(value):
+        """
+        Convert a 'MM/DD/YYYY HH:MM' string to seconds since 1970.
+
+        Args:
+            value (str): The departure date and time.
+
+        Returns:
+            int: seconds from 1970, TicketTable.no_time if the string cannot be parsed.
+        """
+        try:
+            date, clock = value.split(' ')
+            month, day, year = map(int, date.split('/'))
+            hour, minute = map(int, clock.split(':'))
+        except ValueError:
+            return TicketTable.no_time
+        if (year <= 0 or not 1 <= month <= 12 or not 1 <= day <= Date.month_days[Date.is_leap(year)][month - 1]
+                or not 0 <= hour < 24 or not 0 <= minute < 60):
+            return TicketTable.no_time
+        return Date.days_from_civil(year, month, day) * 86400 + hour * 3600 + minute * 60
+
+    def departures(self):
+        """
+        Returns the departure time of every row in seconds since 1970.
+
+        Every distinct date/time string is parsed once and the times of the rows are taken from
+        its codes. Rows appended later are converted on the next call.
+
+        Returns:
+            array: The departure times, TicketTable.no_time for unparsable values.
+        """
+        done = len(self.__departures)
+        if done < len(self):
+            column = self.date_time
+            times = [TicketTable.parse_departure(value) for value in column.values]
+            self.__departures.extend(map(times.__getitem__, column.codes[done:]))
+        return self.__departures
+
+    def departure_order(self):
+        """
+        Returns the row ids and departure times sorted by departure time.
+
+        Rows with unparsable times are left out. The order is rebuilt when the table grows.
+
+        Returns:
+            tuple: The sorted row ids and their departure times.
+        """
+        times = self.departures()
+        if self.__order is None or self.__order[0] != len(self):
+            order = sorted((ind for ind in range(len(times)) if times[ind] != TicketTable.no_time),
+                           key=times.__getitem__)
+            self.__order = (len(self), array('Q', order), array('q', map(times.__getitem__, order)))
+        return self.__order[1], self.__order[2]
+
+    def departures_between(self, start, end):
+        """
+        Returns a view of the rows departing in a time window, sorted by departure time.
+
+        Args:
+            start (int): The start of the window in seconds since 1970, included.
+            end (int): The end of the window in seconds since 1970, excluded.
+
+        Returns:
+            TicketView: The matching rows.
+        """
+        order, times = self.departure_order()
+        return TicketView(self, order[bisect_left(times, start):bisect_left(times, end)])
+
+    def next_departures(self, after, count):
+        """
+        Returns a view of the first rows departing at or after a given time.
+
+        Args:
+            after (int): The time in seconds since 1970.
+            count (int): The maximum number of rows.
+
+        Returns:
+            TicketView: The matching rows sorted by departure time.
+        """
+        order, times = self.departure_order()
+        start = bisect_left(times, after)
+        return TicketView(self, order[start:start + count])
+
+    @staticmethod
+    def merge_departures(*tables):
+        """
+        Lazily merge the rows of several tables by departure time.
+
+        Args:
+            *tables (TicketTable): The tables to merge.
+
+        Yields:
+            tuple: The departure time in seconds since 1970 and the values of the row.
+        """
+        def rows(num, table):
+            order, times = table.departure_order()
+            for ind, time_ in zip(order, times):
+                yield time_, num, ind
+
+        merged = heapq.merge(*(rows(num, table) for num, table in enumerate(tables)))
+        for time_, num, ind in merged:
+            yield time_, tables[num].row(ind)
+
+    def row(self, ind):
+        """
+        Returns the values of a row.
+
+        Args:
+            ind (int): The id of the row.
+
+        Returns:
+            tuple: The values of the row in the order of TicketTable.fields.
+        """
+        return tuple(column[ind] for column in self.columns)
+
+    def format_row(self, ind):
+        """
+        Returns a formatted string representation of a row.
+
+        Args:
+            ind (int): The id of the row.
+
+        Returns:
+            str: The formatted ticket information.
+        """
+        return '|' + '|'.join(column[ind].ljust(width) for column, width in zip(self.columns, self.widths)) + '|'
+
+    def __len__(self):
+        """
+        Returns the number of rows.
+
+        Returns:
+            int: The number of rows.
+        """
+        return len(self.passenger_name)
+
+
+class TicketView:
+    """
+    Represents a read-only view of some rows of a TicketTable without copying them.
+
+    Attributes:
+        table (TicketTable): The table the rows belong to.
+        rows (sequence): The ids of the rows.
+
+    Methods:
+        __init__: Initializes a TicketView object.
+        select: Returns a narrower view of the rows matching all given key values.
+        __len__: Returns the number of rows.
+        __getitem__: Returns the values of a row of the view.
+        __iter__: Iterates over the values of the rows.
+    """
+
+    def __init__(self, table, rows):
+        """
+        Initializes a TicketView object.
+
+        Args:
+            table (TicketTable): The table the rows belong to.
+            rows (sequence): The ids of the rows.
+        """
+        self.table = table
+        self.rows = rows
+
+    def select(self, **predicates):
+        """
+        Returns a narrower view of the rows matching all given key values.
+
+        Args:
+            **predicates: The wanted values, see TicketTable.select.
+
+        Returns:
+            TicketView: The matching rows.
+        """
+        found = set(self.table.select(**predicates).rows)
+        return TicketView(self.table, [ind for ind in self.rows if ind in found])
+
+    def __len__(self):
+        """
+        Returns the number of rows.
+
+        Returns:
+            int: The number of rows.
+        """
+        return len(self.rows)
+
+    def __getitem__(self, ind):
+        """
+        Returns the values of a row of the view.
+
+        Args:
+            ind (int): The position of the row in the view.
+
+        Returns:
+            tuple: The values of the row in the order of TicketTable.fields.
+        """
+        return self.table.row(self.rows[ind])
+
+    def __iter__(self):
+        """
+        Iterates over the values of the rows.
+
+        Yields:
+            tuple: The values of the next row.
+        """
+        row = self.table.row
+        for ind in self.rows:
+            yield row(ind)
+
+
 class AirTicket:
     """
      Represents an air ticket and provides methods for creating and formatting tickets.
 
     Attributes:
+        table (TicketTable): The default table tickets are stored in.
         passenger_name (list): A list containing passenger names.
-        _from (list): A list containing departure locations.
-        to (list): A list containing destination locations.
-        date_time (list): A list containing departure date and time.
-        flight (list): A list containing flight numbers.
-        seat (list): A list containing seat numbers.
-        _class (list): A list containing ticket classes.
-        gate (list): A list containing gate numbers.
+        _from (EncodedColumn): A column containing departure locations.
+        to (EncodedColumn): A column containing destination locations.
+        date_time (EncodedColumn): A column containing departure date and time.
+        flight (EncodedColumn): A column containing flight numbers.
+        seat (EncodedColumn): A column containing seat numbers.
+        _class (EncodedColumn): A column containing ticket classes.
+        gate (EncodedColumn): A column containing gate numbers.
 
     Methods:
         __init__: Initializes an AirTicket object with data from a given string.
+        from_row: Class method to create an AirTicket object from already split values.
+        from_rows: Class method to create AirTicket objects for rows already stored in a table.
+        split: Static method to split a ticket string into the values of a row.
         __str__: Returns a formatted string representation of the AirTicket object.
     """
-    passenger_name = []
-    _from = []
-    to = []
-    date_time = []
-    flight = []
-    seat = []
-    _class = []
-    gate = []
+    table = TicketTable()
+    passenger_name = table.passenger_name
+    _from = table._from
+    to = table.to
+    date_time = table.date_time
+    flight = table.flight
+    seat = table.seat
+    _class = table._class
+    gate = table.gate
 
-    def __init__(self, data):
+    def __init__(self, data, table=None):
         """
         Initializes an AirTicket object with data from a given string.
 
         Args:
             data (str): A string containing ticket information separated by ';'.
+            table (TicketTable, optional): The table to store the ticket in. Defaults to AirTicket.table.
         """
-        person_data = data.split(';')
+        if table is None:
+            table = AirTicket.table
+        person_data = AirTicket.split(data)
         self.name = person_data[0]
-        AirTicket.passenger_name.append(person_data[0])
-        AirTicket._from.append(person_data[1])
-        AirTicket.to.append(person_data[2])
-        AirTicket.date_time.append(person_data[3])
-        AirTicket.flight.append(person_data[4])
-        AirTicket.seat.append(person_data[5])
-        AirTicket._class.append(person_data[6])
-        if person_data[7][-1] == '\n':
-            AirTicket.gate.append(person_data[7][:-1])
-        else:
-            AirTicket.gate.append(person_data[7])
+        self.table = table
+        self.row = table.append(person_data)
+
+    @classmethod
+    def from_row(cls, values, table=None):
+        """
+        Create an AirTicket object from already split values.
+
+        Args:
+            values (tuple): The values of the row in the order of TicketTable.fields.
+            table (TicketTable, optional): The table to store the ticket in. Defaults to AirTicket.table.
+
+        Returns:
+            AirTicket: The new AirTicket object.
+        """
+        if table is None:
+            table = AirTicket.table
+        ticket = cls.__new__(cls)
+        ticket.name = values[0]
+        ticket.table = table
+        ticket.row = table.append(values)
+        return ticket
+
+    @classmethod
+    def from_rows(cls, table, rows):
+        """
+        Create AirTicket objects for rows already stored in a table.
+
+        Args:
+            table (TicketTable): The table the rows are stored in.
+            rows (iterable): The ids of the rows.
+
+        Returns:
+            list: The new AirTicket objects.
+        """
+        names = table.passenger_name
+        tickets = []
+        for ind in rows:
+            ticket = cls.__new__(cls)
+            ticket.name = names[ind]
+            ticket.table = table
+            ticket.row = ind
+            tickets.append(ticket)
+        return tickets
+
+    @staticmethod
+    def split(data):
+        """
+        Split a ticket string into the values of a row.
+
+        A trailing LF or CRLF line break is dropped, so rows read in binary mode
+        match rows read in text mode.
+
+        Args:
+            data (str): A string containing ticket information separated by ';'.
+
+        Returns:
+            tuple: The values of the row in the order of TicketTable.fields.
+        """
+        person_data = data.rstrip('\r\n').split(';')
+        return (person_data[0], person_data[1], person_data[2], person_data[3],
+                person_data[4], person_data[5], person_data[6], person_data[7])
 
     def __str__(self):
         """
@@ -53,39 +673,1118 @@ class AirTicket:
         Returns:
             str: The formatted ticket information.
         """
-        ind = AirTicket.passenger_name.index(self.name)
-        return ('|' + AirTicket.passenger_name[ind] + ' ' * (16 - len(AirTicket.passenger_name[ind])) + '|'
-                + AirTicket._from[ind] + ' ' * (4 - len(AirTicket._from[ind])) + '|' + AirTicket.to[ind] +
-                ' ' * (3 - len(AirTicket.to[ind])) + '|' + AirTicket.date_time[ind] +
-                ' ' * (16 - len(AirTicket.date_time[ind])) + '|' + AirTicket.flight[ind] +
-                ' ' * (20 - len(AirTicket.flight[ind])) + '|' + AirTicket.seat[ind] +
-                ' ' * (4 - len(AirTicket.seat[ind])) + '|' + AirTicket._class[ind] +
-                ' ' * (3 - len(AirTicket._class[ind])) + '|' + AirTicket.gate[ind] +
-                ' ' * (4 - len(AirTicket.gate[ind])) + '|')
+        return self.table.format_row(self.row)
 
 
-class Load:
+class TicketBoard:
     """
-    Represents a data loader for AirTicket objects.
+    Represents a renderer of the departures board for air tickets.
+
+    The row layout is compiled into one format string, and rows are written in batches
+    with a single write call per batch.
 
     Attributes:
-        data (list): A list containing loaded AirTicket objects.
+        titles (tuple): The column titles laid out for the default widths.
+        header (str): The column titles of the board, fitted to the widths of the columns.
+        line_format (str): The compiled format string of a row.
+        width (int): The width of the board in characters.
 
     Methods:
-        write: Reads ticket data from a file and creates AirTicket objects.
+        __init__: Initializes a TicketBoard object and compiles the row layout.
+        rows: Static method to get the values of the rows to render.
+        render: Writes the board with the header, separator lines and rows to a text stream.
     """
-    data = []
+    titles = ('     NAME       ', 'FROM', 'TO ', '   DATE/TIME    ', '       FLIGHT       ', 'SEAT', 'CLS', 'GATE')
 
-    @classmethod
-    def write(cls, file):
+    def __init__(self, widths=TicketTable.widths):
         """
-        Reads ticket data from a file and creates AirTicket objects.
+        Initializes a TicketBoard object and compiles the row layout.
+
+        A title keeps its default layout when its column has the default width and is centered otherwise,
+        so the header and the separator lines always line up with the rows.
 
         Args:
-            file (str): The path to the file containing ticket data.
+            widths (tuple, optional): The widths of the columns. Defaults to TicketTable.widths.
+        """
+        titles = (title if len(title) == width else f'{title.strip():^{width}.{width}}'
+                  for title, width in zip(TicketBoard.titles, widths))
+        self.header = '|' + '|'.join(titles) + '|'
+        self.line_format = '|' + '|'.join(f'{{:<{width}}}' for width in widths) + '|\n'
+        self.width = sum(widths) + len(widths) + 1
+
+    @staticmethod
+    def rows(tickets):
+        """
+        Get the values of the rows to render.
+
+        Args:
+            tickets (TicketTable or iterable): A whole table, a TicketView or AirTicket objects.
+
+        Returns:
+            iterable: The values of every row.
+        """
+        if isinstance(tickets, TicketTable):
+            return zip(*tickets.columns)
+        if isinstance(tickets, TicketView):
+            return iter(tickets)
+        return (ticket.table.row(ticket.row) for ticket in tickets)
+
+    def render(self, tickets, stream=None, batch_size=10000):
+        """
+        Writes the board with the header, separator lines and rows to a text stream.
+
+        Args:
+            tickets (TicketTable or iterable): A whole table, a TicketView or AirTicket objects.
+            stream (file, optional): The text stream to write to. Defaults to sys.stdout.
+            batch_size (int, optional): The number of rows in one write call. Defaults to 10000.
+        """
+        if stream is None:
+            stream = sys.stdout
+        line = self.line_format.format
+        rows = TicketBoard.rows(tickets)
+        stream.write('-' * self.width + '\n' + self.header + '\n' + '=' * self.width + '\n')
+        while True:
+            batch = [line(*values) for values in islice(rows, batch_size)]
+            if not batch:
+                break
+            stream.write(''.join(batch))
+        stream.write('-' * self.width + '\n')
+
+
+class TicketList(MutableSequence):
+    """
+    Represents a list of AirTicket objects that can also hold bare row ids of its table.
+
+    Row ids are added in one step by extend_rows and turned into AirTicket objects on first access.
+    Every way of reading the list, including iteration, slicing, comparison and sorting, returns
+    AirTicket objects, so loading a large table does not build one object per row up front.
+
+    Attributes:
+        table (TicketTable): The table the row ids belong to.
+
+    Methods:
+        __init__: Initializes a TicketList object with tickets of a table.
+        extend_rows: Adds rows of the table without creating AirTicket objects.
+        insert: Inserts a ticket before a position.
+        append: Adds a ticket to the end of the list.
+        extend: Adds many tickets to the end of the list.
+        sort: Sorts the tickets in place.
+        copy: Returns a plain list of the AirTicket objects.
+        __len__: Returns the number of tickets.
+        __getitem__: Returns the AirTicket object at a position or a list of them for a slice.
+        __setitem__: Replaces the ticket at a position or the tickets of a slice.
+        __delitem__: Removes the ticket at a position or the tickets of a slice.
+        __iter__: Iterates over the AirTicket objects.
+        __add__: Concatenates the tickets with another sequence.
+        __eq__: Compares the tickets with another sequence.
+        __repr__: Returns a string representation of the tickets.
+    """
+
+    def __init__(self, tickets=(), table=None):
+        """
+        Initializes a TicketList object with tickets of a table.
+
+        Args:
+            tickets (iterable, optional): The AirTicket objects. Defaults to an empty list.
+            table (TicketTable, optional): The table the row ids belong to. Defaults to AirTicket.table.
+        """
+        self.table = AirTicket.table if table is None else table
+        self.__items = list(tickets)
+
+    def extend_rows(self, rows):
+        """
+        Adds rows of the table without creating AirTicket objects.
+
+        Args:
+            rows (iterable): The ids of the rows.
+        """
+        self.__items.extend(rows)
+
+    def __materialize(self, start=0, stop=None):
+        """
+        Turns the bare row ids in a range of positions into AirTicket objects in one pass.
+
+        Args:
+            start (int, optional): The first position. Defaults to 0.
+            stop (int, optional): The position to stop before. Defaults to the end of the list.
+
+        Returns:
+            list: The AirTicket objects of the range.
+        """
+        items = self.__items
+        if stop is None:
+            stop = len(items)
+        positions = [ind for ind in range(start, stop) if type(items[ind]) is int]
+        if positions:
+            tickets = AirTicket.from_rows(self.table, [items[ind] for ind in positions])
+            for ind, ticket in zip(positions, tickets):
+                items[ind] = ticket
+        return items[start:stop]
+
+    def insert(self, ind, ticket):
+        """
+        Inserts a ticket before a position.
+
+        Args:
+            ind (int): The position.
+            ticket (AirTicket): The ticket.
+        """
+        self.__items.insert(ind, ticket)
+
+    def append(self, ticket):
+        """
+        Adds a ticket to the end of the list.
+
+        Args:
+            ticket (AirTicket): The ticket.
+        """
+        self.__items.append(ticket)
+
+    def extend(self, tickets):
+        """
+        Adds many tickets to the end of the list.
+
+        Args:
+            tickets (iterable): The AirTicket objects.
+        """
+        self.__items.extend(list(tickets) if tickets is self else tickets)
+
+    def sort(self, *, key=None, reverse=False):
+        """
+        Sorts the tickets in place.
+
+        Args:
+            key (callable, optional): The function that returns the sort key of a ticket. Defaults to None.
+            reverse (bool, optional): Sort in descending order. Defaults to False.
+        """
+        self.__materialize()
+        self.__items.sort(key=key, reverse=reverse)
+
+    def copy(self):
+        """
+        Returns a plain list of the AirTicket objects.
+
+        Returns:
+            list: The tickets.
+        """
+        return self.__materialize()
+
+    def __len__(self):
+        """
+        Returns the number of tickets.
+
+        Returns:
+            int: The number of tickets.
+        """
+        return len(self.__items)
+
+    def __getitem__(self, item):
+        """
+        Returns the AirTicket object at a position or a list of them for a slice.
+
+        Args:
+            item (int or slice): The position or a slice of positions.
+
+        Returns:
+            AirTicket or list: The ticket or tickets.
+        """
+        if isinstance(item, slice):
+            start, stop, step = item.indices(len(self.__items))
+            if step == 1:
+                return self.__materialize(start, max(start, stop))
+            return [self[ind] for ind in range(start, stop, step)]
+        ticket = self.__items[item]
+        if type(ticket) is int:
+            ticket = AirTicket.from_rows(self.table, (ticket,))[0]
+            self.__items[item] = ticket
+        return ticket
+
+    def __setitem__(self, item, value):
+        """
+        Replaces the ticket at a position or the tickets of a slice.
+
+        Args:
+            item (int or slice): The position or a slice of positions.
+            value (AirTicket or iterable): The new ticket or tickets.
+        """
+        self.__items[item] = value
+
+    def __delitem__(self, item):
+        """
+        Removes the ticket at a position or the tickets of a slice.
+
+        Args:
+            item (int or slice): The position or a slice of positions.
+        """
+        del self.__items[item]
+
+    def __iter__(self):
+        """
+        Iterates over the AirTicket objects.
+
+        Yields:
+            AirTicket: The next ticket.
+        """
+        for ind, ticket in enumerate(self.__items):
+            yield self[ind] if type(ticket) is int else ticket
+
+    def __add__(self, other):
+        """
+        Concatenates the tickets with another sequence.
+
+        Args:
+            other (iterable): The tickets to add.
+
+        Returns:
+            list: A plain list of the AirTicket objects of both sequences.
+        """
+        return self.__materialize() + list(other)
+
+    def __eq__(self, other):
+        """
+        Compares the tickets with another sequence.
+
+        Args:
+            other (TicketList or list): The sequence to compare with.
+
+        Returns:
+            bool: True if both hold the same tickets in the same order, NotImplemented for other objects.
+        """
+        if isinstance(other, TicketList):
+            return self.__materialize() == other.copy()
+        if isinstance(other, list):
+            return self.__materialize() == other
+        return NotImplemented
+
+    def __repr__(self):
+        """
+        Returns a string representation of the tickets.
+
+        Returns:
+            str: The string representation of the list of AirTicket objects.
+        """
+        return repr(self.__materialize())
+
+
+class Load:
+    """
+    Represents a data loader for AirTicket objects.
+
+    Attributes:
+        data (TicketList): A list containing loaded AirTicket objects.
+
+    Methods:
+        write: Reads ticket data from a file and creates AirTicket objects.
+        stream: Lazily reads ticket data from a file in batches of AirTicket objects.
+        iter_tickets: Lazily reads ticket data from a file one AirTicket object at a time.
+        write_cached: Reads ticket data through a binary TicketCache file.
+        write_parallel: Reads ticket data from a file in several processes.
+        parse_range: Static method to parse the rows in a byte range of a file into a new TicketTable.
+    """
+    data = TicketList()
+
+    @classmethod
+    def write(cls, file):
+        """
+        Reads ticket data from a file and creates AirTicket objects.
+
+        Args:
+            file (str): The path to the file containing ticket data.
         """
         with open(file) as f:
             tickets = f.readlines()
             for n in range(1, len(tickets)):
                 tick = AirTicket(tickets[n])
                 Load.data.append(tick)
+
+    @classmethod
+    def write_cached(cls, file, cache=None):
+        """
+        Reads ticket data through a binary TicketCache file and creates AirTicket objects.
+
+        The cached columns are copied into AirTicket.table as whole arrays, and the rows are added
+        to Load.data as row ids that become AirTicket objects on first access.
+
+        Args:
+            file (str): The path to the file containing ticket data.
+            cache (str, optional): The path to the cache file. Defaults to '<file>.cache'.
+        """
+        table = TicketCache.load(file, cache)
+        if table is None:
+            signature = TicketCache.signature(file)
+            table = TicketCache.parse(file)
+            TicketCache.save(table, file, cache, signature)
+        Load.data.extend_rows(AirTicket.table.extend(table))
+
+    @classmethod
+    def write_parallel(cls, file, workers=None, min_size=1 << 20):
+        """
+        Reads ticket data from a file in several processes and creates AirTicket objects.
+
+        The file is split into byte ranges that start right after a line break. Every range is
+        parsed into a TicketTable in a ProcessPoolExecutor worker. The tables are merged into
+        AirTicket.table column by column in file order and their rows are added to Load.data.
+        Files smaller than min_size, or a single worker, fall back to Load.write.
+
+        Args:
+            file (str): The path to the file containing ticket data.
+            workers (int, optional): The number of processes. Defaults to the number of CPUs.
+            min_size (int, optional): The smallest file size in bytes worth parsing in parallel. Defaults to 1 MiB.
+        """
+        workers = workers or os.cpu_count() or 1
+        size = os.path.getsize(file)
+        if workers <= 1 or size < min_size:
+            Load.write(file)
+            return
+        bounds = []
+        with open(file, 'rb') as f:
+            f.readline()
+            start = f.tell()
+            step = max((size - start) // workers, 1)
+            for k in range(workers):
+                if k:
+                    f.seek(max(start + k * step - 1, bounds[-1]))
+                    f.readline()
+                bounds.append(min(f.tell(), size))
+        bounds.append(size)
+        ranges = [(begin, end) for begin, end in zip(bounds, bounds[1:]) if end > begin]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parts = executor.map(Load.parse_range, [file] * len(ranges), *zip(*ranges))
+            for part in parts:
+                Load.data.extend_rows(AirTicket.table.extend(part))
+
+    @staticmethod
+    def parse_range(file, start, end):
+        """
+        Parse the rows in a byte range of a file into a new TicketTable.
+
+        Args:
+            file (str): The path to the file containing ticket data.
+            start (int): The offset of the first byte of the range.
+            end (int): The offset after the last byte of the range.
+
+        Returns:
+            TicketTable: The parsed rows of the range.
+        """
+        with open(file, 'rb') as f:
+            f.seek(start)
+            chunk = f.read(end - start).decode('utf-8')
+        table = TicketTable()
+        for line in chunk.split('\n'):
+            if line.strip():
+                table.append(AirTicket.split(line))
+        return table
+
+    @classmethod
+    def stream(cls, file, batch_size=1000):
+        """
+        Lazily reads ticket data from a file in batches of AirTicket objects.
+
+        Every batch is stored in its own TicketTable and nothing is added to Load.data,
+        so memory stays bounded by the batch size.
+
+        Args:
+            file (str): The path to the file containing ticket data.
+            batch_size (int, optional): The number of tickets in a batch. Defaults to 1000.
+
+        Yields:
+            list: The next batch of AirTicket objects.
+        """
+        with open(file) as f:
+            next(f, None)
+            while True:
+                lines = list(islice(f, batch_size))
+                if not lines:
+                    break
+                table = TicketTable()
+                yield [AirTicket(line, table) for line in lines if line.strip()]
+
+    @classmethod
+    def iter_tickets(cls, file, batch_size=1000):
+        """
+        Lazily reads ticket data from a file one AirTicket object at a time.
+
+        Args:
+            file (str): The path to the file containing ticket data.
+            batch_size (int, optional): The number of lines read at once. Defaults to 1000.
+
+        Yields:
+            AirTicket: The next ticket.
+        """
+        for batch in Load.stream(file, batch_size):
+            yield from batch
+
+
+class LoadSession:
+    """
+    Represents a loader session that owns its own ticket table instead of the class-level Load.data.
+
+    Independent sessions share no state and can load in parallel threads. A session can also be
+    fed from several threads: files are parsed without a lock and only merged under it.
+    Dropping or closing the session releases all its tickets at once.
+
+    Attributes:
+        table (TicketTable): The table of the session.
+        data (list): The loaded AirTicket objects.
+
+    Methods:
+        __init__: Initializes an empty LoadSession object.
+        write: Reads ticket data from a file into the session.
+        write_many: Reads ticket data from many files in a thread pool.
+        write_async: Reads ticket data from many files concurrently with asyncio.
+        close: Releases all tickets of the session.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty LoadSession object.
+        """
+        self.table = TicketTable()
+        self.data = []
+        self.__lock = threading.Lock()
+
+    def write(self, file):
+        """
+        Reads ticket data from a file into the session.
+
+        Args:
+            file (str): The path to the file containing ticket data.
+
+        Returns:
+            list: The new AirTicket objects.
+        """
+        parsed = TicketCache.parse(file)
+        with self.__lock:
+            tickets = AirTicket.from_rows(self.table, self.table.extend(parsed))
+            self.data.extend(tickets)
+        return tickets
+
+    def write_many(self, files, workers=None):
+        """
+        Reads ticket data from many files in a thread pool.
+
+        Args:
+            files (iterable): The paths to the files containing ticket data.
+            workers (int, optional): The number of threads. Defaults to the ThreadPoolExecutor default.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(self.write, files))
+
+    async def write_async(self, files, concurrency=16):
+        """
+        Reads ticket data from many files concurrently with asyncio.
+
+        The files are read in the default executor, at most concurrency at a time, parsed
+        and merged into the session. A failing file is reported and does not stop the others.
+        The time of a file does not include waiting for the semaphore.
+
+        Args:
+            files (iterable): The paths to the files containing ticket data.
+            concurrency (int, optional): The maximum number of files read at once. Defaults to 16.
+
+        Returns:
+            list: A FileResult with the path, seconds, number of tickets and error for every file.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        def read(file):
+            with open(file) as f:
+                return f.readlines()
+
+        async def load(file):
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    lines = await loop.run_in_executor(None, read, file)
+                    parsed = TicketCache.parse_lines(lines)
+                    with self.__lock:
+                        rows = self.table.extend(parsed)
+                        self.data.extend(AirTicket.from_rows(self.table, rows))
+                except (OSError, ValueError, IndexError) as error:
+                    return FileResult(file, time.perf_counter() - start, 0, error)
+                return FileResult(file, time.perf_counter() - start, len(rows), None)
+
+        return await asyncio.gather(*(load(file) for file in files))
+
+    def close(self):
+        """
+        Releases all tickets of the session.
+        """
+        with self.__lock:
+            self.table = TicketTable()
+            self.data = []
+
+    def __enter__(self):
+        """
+        Enters the context of the LoadSession.
+
+        Returns:
+            LoadSession: The LoadSession object itself.
+        """
+        return self
+
+    def __exit__(self, *exc):
+        """
+        Closes the session when leaving the context.
+
+        Args:
+            *exc: The exception type, value and traceback, if any.
+        """
+        self.close()
+
+
+class TicketFile:
+    """
+    Represents a memory-mapped ticket file with random access to its rows.
+
+    The byte offsets of the rows are kept in an array('Q') index, saved next to the file
+    as '<file>.idx' after a header with the size and modification time of the file and the number of rows.
+
+    Attributes:
+        file (str): The path to the file containing ticket data.
+        encoding (str): The encoding of the file.
+        offsets (array): The byte offsets of the rows.
+
+    Methods:
+        __init__: Opens and maps a ticket file and loads or builds its row index.
+        close: Closes the file.
+        __len__: Returns the number of rows.
+        __getitem__: Returns the AirTicket object for a row or a list of them for a slice.
+        __iter__: Lazily iterates over all rows.
+    """
+
+    def __init__(self, file, encoding='utf-8'):
+        """
+        Opens and maps a ticket file and loads or builds its row index.
+
+        Args:
+            file (str): The path to the file containing ticket data.
+            encoding (str, optional): The encoding of the file. Defaults to 'utf-8'.
+        """
+        self.file = file
+        self.encoding = encoding
+        self.__handle = open(file, 'rb')
+        stat = os.fstat(self.__handle.fileno())
+        self.__size = stat.st_size
+        self.__stamp = (stat.st_size, stat.st_mtime_ns)
+        if self.__size:
+            self.__map = mmap.mmap(self.__handle.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self.__map = b''
+        self.offsets = self.__load_index()
+        if self.offsets is None:
+            self.offsets = self.__build_index()
+            self.__save_index()
+
+    def __load_index(self):
+        """
+        Loads the saved row index if it matches the current file.
+
+        Returns:
+            array: The byte offsets of the rows, None if there is no valid saved index.
+        """
+        try:
+            with open(self.file + '.idx', 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        index = array('Q')
+        if len(data) % index.itemsize:
+            return None
+        index.frombytes(data)
+        if len(index) < 3 or tuple(index[:2]) != self.__stamp or len(index) != index[2] + 3:
+            return None
+        if len(index) > 3 and index[-1] >= self.__size:
+            return None
+        return index[3:]
+
+    def __build_index(self):
+        """
+        Scans the file once and records the byte offsets of the rows after the header.
+
+        Blank lines, including a bare CRLF line break, are skipped like in Load.stream.
+
+        Returns:
+            array: The byte offsets of the rows.
+        """
+        index = array('Q')
+        find = self.__map.find
+        start = find(b'\n') + 1
+        if not start:
+            return index
+        while start < self.__size:
+            end = find(b'\n', start)
+            if end == -1:
+                end = self.__size
+            if self.__map[start:end].strip():
+                index.append(start)
+            start = end + 1
+        return index
+
+    def __save_index(self):
+        """
+        Saves the row index next to the file, ignoring read-only locations.
+
+        The index is written to a temporary file first and then moved into place,
+        so a reader never sees a partly written index.
+        """
+        temp = f'{self.file}.idx.{os.getpid()}.tmp'
+        try:
+            with open(temp, 'wb') as f:
+                array('Q', (*self.__stamp, len(self.offsets))).tofile(f)
+                self.offsets.tofile(f)
+            os.replace(temp, self.file + '.idx')
+        except OSError:
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+
+    def __line(self, ind):
+        """
+        Decodes a row of the file.
+
+        Args:
+            ind (int): The number of the row.
+
+        Returns:
+            str: The row without the line break.
+        """
+        start = self.offsets[ind]
+        end = self.__map.find(b'\n', start)
+        if end == -1:
+            end = self.__size
+        return self.__map[start:end].decode(self.encoding)
+
+    def close(self):
+        """
+        Closes the file.
+        """
+        if self.__size:
+            self.__map.close()
+        self.__handle.close()
+
+    def __enter__(self):
+        """
+        Enters the context of the TicketFile.
+
+        Returns:
+            TicketFile: The TicketFile object itself.
+        """
+        return self
+
+    def __exit__(self, *exc):
+        """
+        Closes the file when leaving the context.
+
+        Args:
+            *exc: The exception type, value and traceback, if any.
+        """
+        self.close()
+
+    def __len__(self):
+        """
+        Returns the number of rows.
+
+        Returns:
+            int: The number of rows.
+        """
+        return len(self.offsets)
+
+    def __getitem__(self, item):
+        """
+        Returns the AirTicket object for a row or a list of them for a slice.
+
+        Args:
+            item (int or slice): The number of the row or a slice of rows.
+
+        Returns:
+            AirTicket or list: The decoded ticket or tickets.
+        """
+        table = TicketTable()
+        if isinstance(item, slice):
+            return [AirTicket(self.__line(ind), table) for ind in range(*item.indices(len(self.offsets)))]
+        return AirTicket(self.__line(item), table)
+
+    def __iter__(self):
+        """
+        Lazily iterates over all rows.
+
+        Yields:
+            AirTicket: The next ticket.
+        """
+        for ind in range(len(self.offsets)):
+            yield self[ind]
+
+
+class TicketCache:
+    """
+    Represents a binary cache of parsed ticket columns.
+
+    Every column is stored as a table of its distinct values and an array of codes
+    into that table. Dictionary-encoded columns are written and read back as they are.
+    The cache keeps the size, modification time and a BLAKE2b hash of the source file
+    and is reused while the file is unchanged.
+
+    Attributes:
+        magic (bytes): The marker at the start of a cache file.
+        header (Struct): The layout of the cache header.
+
+    Methods:
+        path: Static method to return the cache path for a ticket file.
+        stamp: Static method to return the size and modification time of a file.
+        digest: Static method to return the content hash of a file.
+        signature: Static method to return the size, modification time and content hash of a file.
+        parse: Static method to parse a ticket file into a new TicketTable.
+        parse_lines: Static method to parse the lines of a ticket file into a new TicketTable.
+        save: Static method to write a table to a cache file.
+        write: Static method to write the content of a cache file through a temporary file.
+        load: Static method to read a table from a cache file if it is still valid.
+        decode: Static method to rebuild the columns of a table from the body of a cache file.
+    """
+    magic = b'TKC1'
+    header = struct.Struct('<4sQq32sQ')
+
+    @staticmethod
+    def path(file, cache=None):
+        """
+        Return the cache path for a ticket file.
+
+        Args:
+            file (str): The path to the file containing ticket data.
+            cache (str, optional): An explicit cache path. Defaults to '<file>.cache'.
+
+        Returns:
+            str: The path to the cache file.
+        """
+        return cache if cache is not None else file + '.cache'
+
+    @staticmethod
+    def stamp(file):
+        """
+        Return the size and modification time of a file.
+
+        Args:
+            file (str): The path to the file.
+
+        Returns:
+            tuple: The size in bytes and the modification time in nanoseconds.
+        """
+        stat = os.stat(file)
+        return stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def digest(file):
+        """
+        Return the content hash of a file.
+
+        Args:
+            file (str): The path to the file.
+
+        Returns:
+            bytes: The 32-byte BLAKE2b digest.
+        """
+        blake = hashlib.blake2b(digest_size=32)
+        with open(file, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                blake.update(chunk)
+        return blake.digest()
+
+    @staticmethod
+    def signature(file):
+        """
+        Return the size, modification time and content hash of a file.
+
+        Taken before the file is parsed, so a change made while parsing leaves the cache stale
+        instead of marking old rows as valid for the new content.
+
+        Args:
+            file (str): The path to the file.
+
+        Returns:
+            tuple: The size in bytes, the modification time in nanoseconds and the BLAKE2b digest.
+        """
+        return (*TicketCache.stamp(file), TicketCache.digest(file))
+
+    @staticmethod
+    def parse(file):
+        """
+        Parse a ticket file into a new TicketTable.
+
+        Args:
+            file (str): The path to the file containing ticket data.
+
+        Returns:
+            TicketTable: The parsed rows.
+        """
+        with open(file) as f:
+            return TicketCache.parse_lines(f)
+
+    @staticmethod
+    def parse_lines(lines):
+        """
+        Parse the lines of a ticket file, header included, into a new TicketTable.
+
+        Args:
+            lines (iterable): The lines of the file.
+
+        Returns:
+            TicketTable: The parsed rows.
+        """
+        table = TicketTable()
+        lines = iter(lines)
+        next(lines, None)
+        for line in lines:
+            if line.strip():
+                table.append(AirTicket.split(line))
+        return table
+
+    @staticmethod
+    def save(table, file, cache=None, signature=None):
+        """
+        Write a table to a cache file, ignoring read-only locations.
+
+        The cache is written to a temporary file first and then moved into place,
+        so a reader never sees a partly written cache.
+
+        Args:
+            table (TicketTable): The parsed rows of the file.
+            file (str): The path to the file containing ticket data.
+            cache (str, optional): The path to the cache file. Defaults to '<file>.cache'.
+            signature (tuple, optional): The result of TicketCache.signature taken before parsing.
+                Defaults to the current signature of the file.
+        """
+        if signature is None:
+            signature = TicketCache.signature(file)
+        parts = [TicketCache.header.pack(TicketCache.magic, *signature, len(table))]
+        for column in table.columns:
+            if isinstance(column, EncodedColumn):
+                lookup = column.values
+                codes = array(column.codes.typecode, column.codes)
+            else:
+                lookup = {}
+                codes = [lookup.setdefault(value, len(lookup)) for value in column]
+                codes = array('B' if len(lookup) <= 0xFF else 'H' if len(lookup) <= 0xFFFF else 'I', codes)
+            typecode = codes.typecode
+            if sys.byteorder == 'big':
+                codes.byteswap()
+            values = '\n'.join(lookup).encode('utf-8')
+            parts.append(struct.pack('<cQQ', typecode.encode(), len(lookup), len(values)))
+            parts.append(values)
+            parts.append(codes.tobytes())
+        TicketCache.write(TicketCache.path(file, cache), b''.join(parts))
+
+    @staticmethod
+    def write(path, data):
+        """
+        Write the content of a cache file through a temporary file, ignoring read-only locations.
+
+        Args:
+            path (str): The path to the cache file.
+            data (bytes): The content of the cache file.
+        """
+        temp = f'{path}.{os.getpid()}.tmp'
+        try:
+            with open(temp, 'wb') as f:
+                f.write(data)
+            os.replace(temp, path)
+        except OSError:
+            try:
+                os.remove(temp)
+            except OSError:
+                pass
+
+    @staticmethod
+    def load(file, cache=None):
+        """
+        Read a table from a cache file if it is still valid for the ticket file.
+
+        The cache is valid if the size and modification time of the file are unchanged,
+        or if the size is unchanged and the content hash still matches. A truncated or corrupt
+        cache is treated as missing. After a hit that needed the hash, the new modification time is
+        written to the cache, so the next load does not hash the file again.
+
+        Args:
+            file (str): The path to the file containing ticket data.
+            cache (str, optional): The path to the cache file. Defaults to '<file>.cache'.
+
+        Returns:
+            TicketTable: The cached rows, None if there is no valid cache.
+        """
+        try:
+            with open(TicketCache.path(file, cache), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        if len(data) < TicketCache.header.size:
+            return None
+        magic, size, mtime, digest, rows = TicketCache.header.unpack_from(data)
+        if magic != TicketCache.magic:
+            return None
+        current = TicketCache.stamp(file)
+        if current[0] != size or (current[1] != mtime and TicketCache.digest(file) != digest):
+            return None
+        try:
+            table = TicketCache.decode(data, rows)
+        except (struct.error, ValueError, UnicodeDecodeError):
+            return None
+        if current[1] != mtime:
+            header = TicketCache.header.pack(magic, size, current[1], digest, rows)
+            TicketCache.write(TicketCache.path(file, cache), header + data[TicketCache.header.size:])
+        return table
+
+    @staticmethod
+    def decode(data, rows):
+        """
+        Rebuild the columns of a table from the body of a cache file.
+
+        Args:
+            data (bytes): The content of the cache file.
+            rows (int): The number of rows from the header.
+
+        Returns:
+            TicketTable: The cached rows.
+
+        Raises:
+            ValueError: If a value table or code array does not match the number of rows.
+            struct.error: If the cache file is truncated.
+            UnicodeDecodeError: If a value table is not valid UTF-8.
+        """
+        table = TicketTable()
+        pos = TicketCache.header.size
+        for column in table.columns:
+            typecode, count, length = struct.unpack_from('<cQQ', data, pos)
+            pos += struct.calcsize('<cQQ')
+            if typecode not in (b'B', b'H', b'I'):
+                raise ValueError('unknown cache code type')
+            values = data[pos:pos + length].decode('utf-8').split('\n') if count else []
+            pos += length
+            codes = array(typecode.decode())
+            end = pos + rows * codes.itemsize
+            if len(values) != count or end > len(data):
+                raise ValueError('truncated cache column')
+            codes.frombytes(data[pos:end])
+            pos = end
+            if sys.byteorder == 'big':
+                codes.byteswap()
+            if rows and max(codes) >= count:
+                raise ValueError('cache code out of range')
+            if isinstance(column, EncodedColumn):
+                column.load(values, codes)
+            else:
+                column.extend(map(values.__getitem__, codes))
+        if pos != len(data):
+            raise ValueError('trailing data in cache')
+        return table
+
+
+class TicketFollower:
+    """
+    Represents a follower of a growing ticket file that parses only appended rows.
+
+    The follower remembers the byte offset after the last complete line. A half-written
+    last line is held back until its line break arrives. If the file is truncated or
+    replaced by a new file, it is read again from the start, with its header skipped again.
+    Malformed lines are kept in rejected and do not stop the valid lines around them.
+
+    Attributes:
+        file (str): The path to the file containing ticket data.
+        table (TicketTable): The table new tickets are stored in.
+        offset (int): The byte offset after the last parsed line.
+        inode (int): The inode of the followed file.
+        head (bytes): The first bytes of the followed file, used to notice a replaced file that reuses the inode.
+        subscribers (list): The callbacks receiving every list of new tickets.
+        rejected (list): The raw bytes of the malformed lines that were skipped.
+
+    Methods:
+        __init__: Initializes a TicketFollower object.
+        subscribe: Adds a callback for new tickets.
+        poll: Parses the lines appended since the last call.
+        follow: Lazily yields new tickets, polling the file at a fixed interval.
+    """
+
+    def __init__(self, file, table=None):
+        """
+        Initializes a TicketFollower object.
+
+        Args:
+            file (str): The path to the file containing ticket data.
+            table (TicketTable, optional): The table new tickets are stored in. Defaults to a new TicketTable.
+        """
+        self.file = file
+        self.table = table if table is not None else TicketTable()
+        self.offset = 0
+        self.inode = None
+        self.head = b''
+        self.subscribers = []
+        self.rejected = []
+
+    def subscribe(self, callback):
+        """
+        Adds a callback for new tickets.
+
+        Args:
+            callback (callable): The function called with every non-empty list of new AirTicket objects.
+        """
+        self.subscribers.append(callback)
+
+    def poll(self):
+        """
+        Parses the complete lines appended since the last call.
+
+        All lines are split before anything changes, malformed lines are moved to rejected,
+        and only then the offset is advanced and the tickets are stored and sent to the subscribers.
+
+        Returns:
+            list: The new AirTicket objects.
+        """
+        try:
+            f = open(self.file, 'rb')
+        except FileNotFoundError:
+            return []
+        with f:
+            stat = os.fstat(f.fileno())
+            if stat.st_ino != self.inode or stat.st_size < self.offset or f.read(len(self.head)) != self.head:
+                self.inode = stat.st_ino
+                self.offset = 0
+            if stat.st_size == self.offset:
+                return []
+            f.seek(self.offset)
+            data = f.read(stat.st_size - self.offset)
+        if not self.offset:
+            self.head = data[:64]
+        end = data.rfind(b'\n')
+        if end == -1:
+            return []
+        lines = data[:end].split(b'\n')
+        if not self.offset:
+            lines = lines[1:]
+        rows = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                rows.append(AirTicket.split(line.decode('utf-8')))
+            except (UnicodeDecodeError, IndexError):
+                self.rejected.append(line)
+        self.offset += end + 1
+        tickets = [AirTicket.from_row(values, self.table) for values in rows]
+        if tickets:
+            for callback in self.subscribers:
+                callback(tickets)
+        return tickets
+
+    def follow(self, interval=1.0):
+        """
+        Lazily yields new tickets, polling the file at a fixed interval.
+
+        Args:
+            interval (float, optional): The number of seconds between two polls. Defaults to 1.0.
+
+        Yields:
+            AirTicket: The next new ticket.
+        """
+        while True:
+            yield from self.poll()
+            time.sleep(interval)
@@ -1,238 +1,892 @@
-class Date:
+import asyncio
+import sqlite3
+import sys
+import threading
+import time
+from bisect import bisect_left, bisect_right, insort
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from solution_1 import Date
+
+FileResult = namedtuple('FileResult', ('path', 'seconds', 'rows', 'error'))
+
+
+class MeetingStore:
     """
-    Represents a date and provides methods for date manipulation and comparison.
+    Represents a store of meetings and users.
 
     Attributes:
-        days (dict): A dictionary containing the number of days for each month.
-        month (dict): A dictionary mapping month numbers to their abbreviated names.
+        meetings (list): A list containing the Meeting objects of the store.
+        users (list): A list containing the User objects of the store.
+        meetings_by_id (dict): The first Meeting object registered for every meeting id.
+        users_by_id (dict): The first User object registered for every user id.
+        duplicate_meetings (set): The meeting ids registered by more than one Meeting object.
+        duplicate_users (set): The user ids registered by more than one User object.
+        user_meetings (dict): The set of Meeting objects for every User object.
+        last_join (JoinReport): The result of the latest membership join.
+        by_date (dict): The meetings for every date, keyed by days since 1970.
+        dates (list): The sorted days since 1970 that have meetings.
+        participants (int): The total number of participants in all meetings.
+        participants_by_date (dict): The number of participants for every date, keyed by days since 1970.
 
     Methods:
-        __init__: Initializes a Date object with a given date string.
-        leap_year: Static method to determine if a given year is a leap year.
-        check_date: Instance method to validate the format and correctness of the date string.
-        date: Getter property to retrieve the formatted date string.
-        date.setter: Setter property to set the date from a given string.
-        to_timestamp: Instance method to count time since 1970.
-        __eq__: Instance method to check equality between two Date objects.
-        __ne__: Instance method to check inequality between two Date objects.
-        __lt__: Instance method to check if one Date object is less than another.
-        __le__: Instance method to check if one Date object is less than or equal to another.
-        __gt__: Instance method to check if one Date object is greater than another.
-        __ge__: Instance method to check if one Date object is greater than or equal to another.
-        __str__: Instance method to return a string representation of the Date object.
-        __repr__: Instance method to return a string representation of the Date object.
+        __init__: Initializes an empty MeetingStore object.
+        add_meeting: Adds a meeting to the store, its id registry and its date index, recording clashing ids.
+        add_user: Adds a user to the store and its id registry, recording clashing ids.
+        join: Links memberships given by meeting and user ids in one pass.
+        registered_user: Returns the User object for a user or a user id.
+        link: Adds a participant to a meeting and updates the aggregates, unless the user already attends it.
+        unlink: Removes a participant from a meeting and updates the aggregates.
+        meetings_of: Returns the meetings a user attends.
+        count_user_on: Counts the meetings a user attends on a given date.
+        co_attendees: Returns the users sharing at least one meeting with a user.
+        common_meetings: Returns the meetings two users both attend.
+        load: Reads data from files and creates Meeting and User objects in the store.
+        load_lines: Creates Meeting and User objects in the store from the lines of the files.
+        parse_lines: Static method to split the lines of the files into rows and pairs.
+        merge: Creates Meeting and User objects in the store from parsed rows and pairs.
+        count_meeting: Counts the number of meetings on a given date.
+        count_between: Counts the number of meetings between two dates.
+        between: Lazily iterates over the meetings between two dates.
+        total: Counts the total number of participants in all meetings.
+        participants_on: Counts the number of participants of the meetings on a given date.
+        check: Recomputes the aggregates from scratch and compares them with the running ones.
     """
-    days = {}
-    month = {'01': 'янв',
-             '02': 'фев',
-             '03': 'мар',
-             '04': 'апр',
-             '05': 'май',
-             '06': 'июн',
-             '07': 'июл',
-             '08': 'авг',
-             '09': 'сен',
-             '10': 'окт',
-             '11': 'ноя',
-             '12': 'дек'}
 
-    def __init__(self, dt):
+    def __init__(self):
+        """
+        Initializes an empty MeetingStore object.
+        """
+        self.meetings = []
+        self.users = []
+        self.meetings_by_id = {}
+        self.users_by_id = {}
+        self.duplicate_meetings = set()
+        self.duplicate_users = set()
+        self.user_meetings = {}
+        self.last_join = None
+        self.by_date = {}
+        self.dates = []
+        self.participants = 0
+        self.participants_by_date = {}
+
+    def add_meeting(self, meeting):
+        """
+        Adds a meeting to the store, its id registry and its date index, recording clashing ids.
+
+        The index uses the date the meeting has when it is added. A second meeting with an already
+        registered id is kept in the store, but the registry still points to the first one and the id
+        is added to duplicate_meetings.
+
+        Args:
+            meeting (Meeting): The meeting to add.
+        """
+        self.meetings.append(meeting)
+        if meeting.id in self.meetings_by_id:
+            self.duplicate_meetings.add(meeting.id)
+        else:
+            self.meetings_by_id[meeting.id] = meeting
+        ordinal = meeting.date.ordinal
+        if ordinal not in self.by_date:
+            self.by_date[ordinal] = []
+            if ordinal is not None:
+                insort(self.dates, ordinal)
+        self.by_date[ordinal].append(meeting)
+        for user in meeting.employees:
+            self.user_meetings.setdefault(user, set()).add(meeting)
+        if meeting.employees:
+            self.participants += len(meeting.employees)
+            self.participants_by_date[ordinal] = self.participants_by_date.get(ordinal, 0) + len(meeting.employees)
+
+    def add_user(self, user):
+        """
+        Adds a user to the store and its id registry, recording clashing ids.
+
+        A second user with an already registered id is kept in the store, but the registry
+        still points to the first one and the id is added to duplicate_users.
+
+        Args:
+            user (User): The user to add.
+        """
+        self.users.append(user)
+        if user.id in self.users_by_id:
+            self.duplicate_users.add(user.id)
+        else:
+            self.users_by_id[user.id] = user
+
+    def join(self, pairs, meetings=None, users=None):
+        """
+        Links memberships given by meeting and user ids in one pass.
+
+        Ids are looked up in the id registries, so they may be sparse and in any order.
+        Pairs with an unknown id and repeated pairs are counted in the report instead of raising.
+
+        Args:
+            pairs (iterable): The (meeting id, user id) pairs.
+            meetings (dict, optional): The Meeting object for every meeting id. Defaults to meetings_by_id.
+            users (dict, optional): The User object for every user id. Defaults to users_by_id.
+
+        Returns:
+            JoinReport: The number of linked pairs and the unknown ids.
+        """
+        report = JoinReport()
+        if meetings is None:
+            meetings = self.meetings_by_id
+        if users is None:
+            users = self.users_by_id
+        for id_meet, id_pers in pairs:
+            meeting = meetings.get(id_meet)
+            user = users.get(id_pers)
+            if meeting is None or user is None:
+                report.skip(id_meet if meeting is None else None, id_pers if user is None else None)
+            elif self.link(meeting, user):
+                report.linked += 1
+            else:
+                report.repeated += 1
+        self.last_join = report
+        return report
+
+    def link(self, meeting, user):
+        """
+        Adds a participant to a meeting and updates the aggregates, unless the user already attends it.
+
+        Args:
+            meeting (Meeting): The meeting.
+            user (User): The participant.
+
+        Returns:
+            bool: True if the membership is new.
+        """
+        if user in meeting.employees:
+            return False
+        meeting.employees.append(user)
+        self.user_meetings.setdefault(user, set()).add(meeting)
+        ordinal = meeting.date.ordinal
+        self.participants += 1
+        self.participants_by_date[ordinal] = self.participants_by_date.get(ordinal, 0) + 1
+        return True
+
+    def unlink(self, meeting, user):
         """
-        Initializes a Date object with a given date string.
+        Removes a participant from a meeting and updates the aggregates.
 
         Args:
-            dt (str): The date string in the format 'DD.MM.YYYY'.
+            meeting (Meeting): The meeting.
+            user (User): The participant.
         """
-        self.__date = None
-        Date.check_date(self, dt)
+        meeting.employees.remove(user)
+        self.user_meetings[user].discard(meeting)
+        ordinal = meeting.date.ordinal
+        self.participants -= 1
+        self.participants_by_date[ordinal] -= 1
+
+    def registered_user(self, user):
+        """
+        Returns the User object for a user or a user id.
+
+        Args:
+            user (User or int): The user or the user id.
+
+        Returns:
+            User: The user itself, or the first user registered with the id, None for an unknown id.
+        """
+        if isinstance(user, User):
+            return user
+        return self.users_by_id.get(user)
+
+    def meetings_of(self, user):
+        """
+        Returns the meetings a user attends.
+
+        Args:
+            user (User or int): The user or the user id.
+
+        Returns:
+            list: The Meeting objects sorted by date and id.
+        """
+        meetings = list(self.user_meetings.get(self.registered_user(user), ()))
+        meetings.sort(key=lambda meeting: (meeting.date.ordinal is None, meeting.date.ordinal or 0, meeting.id))
+        return meetings
+
+    def count_user_on(self, user, date):
+        """
+        Counts the meetings a user attends on a given date.
+
+        Args:
+            user (User or int): The user or the user id.
+            date (Date): The date of the meetings.
+
+        Returns:
+            int: The number of meetings.
+        """
+        meetings = self.user_meetings.get(self.registered_user(user), ())
+        if len(meetings) > len(self.by_date.get(date.ordinal, ())):
+            return sum(1 for meeting in self.by_date.get(date.ordinal, ()) if meeting in meetings)
+        return sum(1 for meeting in meetings if meeting.date.ordinal == date.ordinal)
+
+    def co_attendees(self, user):
+        """
+        Returns the users sharing at least one meeting with a user.
+
+        Args:
+            user (User or int): The user or the user id.
+
+        Returns:
+            set: The other User objects.
+        """
+        user = self.registered_user(user)
+        result = set()
+        for meeting in self.user_meetings.get(user, ()):
+            result.update(meeting.employees)
+        result.discard(user)
+        return result
+
+    def common_meetings(self, user, other):
+        """
+        Returns the meetings two users both attend.
+
+        Args:
+            user (User or int): The first user or user id.
+            other (User or int): The second user or user id.
+
+        Returns:
+            list: The Meeting objects sorted by id.
+        """
+        meetings = self.user_meetings.get(self.registered_user(user), set())
+        meetings = meetings & self.user_meetings.get(self.registered_user(other), set())
+        return sorted(meetings, key=lambda meeting: meeting.id)
+
+    def load(self, file_meet, file_empl, file_pers):
+        """
+        Reads data from files and creates Meeting and User objects in the store.
+
+        Memberships are linked by the meeting and user ids of the loaded files, so several groups
+        may use the same ids. The join result is kept in last_join.
+
+        Args:
+            file_meet (str): The path to the file containing meeting data.
+            file_empl (str): The path to the file containing employee data.
+            file_pers (str): The path to the file containing employee and meeting data.
+
+        Returns:
+            list: The new Meeting objects.
+        """
+        with open(file_meet, encoding='utf-8') as f_1:
+            meets = f_1.readlines()
+        with open(file_empl, encoding='utf-8') as f_2:
+            users = f_2.readlines()
+        with open(file_pers, encoding='utf-8') as f_3:
+            meet_pers = f_3.readlines()
+        return self.load_lines(meets, users, meet_pers)
+
+    def load_lines(self, meets, users, meet_pers):
+        """
+        Creates Meeting and User objects in the store from the lines of the files, headers included.
+
+        All lines are parsed before the store is changed, so a malformed group leaves no
+        meetings or users behind.
+
+        Args:
+            meets (list): The lines of the file containing meeting data.
+            users (list): The lines of the file containing employee data.
+            meet_pers (list): The lines of the file containing employee and meeting data.
+
+        Returns:
+            list: The new Meeting objects.
+        """
+        return self.merge(*MeetingStore.parse_lines(meets, users, meet_pers))
 
     @staticmethod
-    def leap_year(year):
+    def parse_lines(meets, users, meet_pers):
         """
-        Determine if a given year is a leap year.
+        Splits the lines of the files, headers included, into rows and pairs without changing any store.
 
         Args:
-            year (int): The year to be checked.
+            meets (list): The lines of the file containing meeting data.
+            users (list): The lines of the file containing employee data.
+            meet_pers (list): The lines of the file containing employee and meeting data.
 
         Returns:
-            dict: A dictionary containing the number of days for each month.
+            tuple: The (id, date, title) meeting rows, the user rows and the (meeting id, user id) pairs.
+
+        Raises:
+            ValueError: If an id is not a number or a user row has a wrong number of fields.
+            IndexError: If a meeting row has too few fields.
         """
-        if (year % 4 == 0 and year % 100 != 0) or year % 400 == 0:
-            Date.days = {1: 31, 2: 29, 3: 31, 4: 30, 5: 31, 6: 30, 7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31}
-        else:
-            Date.days = {1: 31, 2: 28, 3: 31, 4: 30, 5: 31, 6: 30, 7: 31, 8: 31, 9: 30, 10: 31, 11: 30, 12: 31}
+        meeting_rows = [Meeting.split(meets[n]) for n in range(1, len(meets))]
+
+        user_rows = []
+        for n in range(1, len(users)):
+            inf = User.split(users[n])
+            if not 3 <= len(inf) <= 6:
+                raise ValueError(f'wrong user row: {users[n]!r}')
+            user_rows.append((int(inf[0]), *inf[1:]))
+
+        pairs = []
+        for n in range(1, len(meet_pers)):
+            pers = meet_pers[n].split(';')
+            if len(pers) > 1:
+                pairs.append((int(pers[0]), int(pers[1])))
+        return meeting_rows, user_rows, pairs
+
+    def merge(self, meeting_rows, user_rows, pairs):
+        """
+        Creates Meeting and User objects in the store from parsed rows and pairs.
+
+        The pairs are joined against the meetings and users of these rows only, so the ids are
+        relative to the loaded group. Ids that repeat within the rows or clash with other
+        objects of the store are recorded in the duplicates of the join report.
 
-    def check_date(self, value):
+        Args:
+            meeting_rows (list): The (id, date, title) meeting rows.
+            user_rows (list): The (id, nick_name, first_name, ...) user rows.
+            pairs (list): The (meeting id, user id) pairs.
+
+        Returns:
+            list: The new Meeting objects.
         """
-        Validate the format and correctness of the date string.
+        meet_base = len(self.meetings)
+        meetings = {}
+        duplicate_meetings = set()
+        for row in meeting_rows:
+            meeting = Meeting.from_row(row, store=self)
+            if meeting.id in meetings or self.meetings_by_id[meeting.id] is not meeting:
+                duplicate_meetings.add(meeting.id)
+            meetings.setdefault(meeting.id, meeting)
+        users = {}
+        duplicate_users = set()
+        for row in user_rows:
+            user = User.get(*row, store=self)
+            if users.get(user.id, user) is not user or self.users_by_id[user.id] is not user:
+                duplicate_users.add(user.id)
+            users.setdefault(user.id, user)
+        report = self.join(pairs, meetings, users)
+        report.duplicate_meetings = duplicate_meetings
+        report.duplicate_users = duplicate_users
+        return self.meetings[meet_base:]
+
+    def count_meeting(self, date):
+        """
+        Counts the number of meetings on a given date.
 
         Args:
-            value (str): The date string to be validated.
+            date (Date): The date of the meetings to count.
+
+        Returns:
+            int: The number of meetings on the given date.
         """
-        if not isinstance(value, str):
-            print('ошибка')
-            self.__date = None
-        else:
-            new_value = value.split('.')
-            if len(new_value) > 3:
-                print('ошибка')
-                self.__date = None
-            day = new_value[0]
-            month = new_value[1]
-            year = new_value[2]
-            if len(day) != 2 or len(month) != 2 or len(year) != 4 or any(
-                    int(i) <= 0 for i in [day, month, year]):
-                print('ошибка')
-                self.__date = None
-            else:
-                day = int(day)
-                month = int(month)
-                year = int(year)
-                Date.leap_year(year)
-                if month not in Date.days or Date.days[month] < day:
-                    print('ошибка')
-                    self.__date = None
-                else:
-                    self.__date = value
+        return len(self.by_date.get(date.ordinal, ()))
 
-    @property
-    def date(self):
+    def count_between(self, start, end):
         """
-        Get the formatted date string.
+        Counts the number of meetings between two dates, both included.
+
+        Args:
+            start (Date): The first date.
+            end (Date): The last date.
 
         Returns:
-            str: The formatted date string.
+            int: The number of meetings between the dates.
         """
-        if self.__date is None:
-            return None
-        dt = self.__date.split('.')
-        return f'{dt[0]} {Date.month[dt[1]]} {dt[2]}г.'
+        dates = self.dates[bisect_left(self.dates, start.ordinal):bisect_right(self.dates, end.ordinal)]
+        return sum(len(self.by_date[ordinal]) for ordinal in dates)
 
-    @date.setter
-    def date(self, new_dt):
+    def between(self, start, end):
         """
-        Set the date from a given string.
+        Lazily iterates over the meetings between two dates, both included, in date order.
 
         Args:
-            new_dt (str): The new date string.
+            start (Date): The first date.
+            end (Date): The last date.
+
+        Yields:
+            Meeting: The next meeting.
         """
-        Date.check_date(self, new_dt)
+        for ind in range(bisect_left(self.dates, start.ordinal), bisect_right(self.dates, end.ordinal)):
+            yield from self.by_date[self.dates[ind]]
 
-    def to_timestamp(self):
+    def total(self):
         """
-        Count time since 1970.
+        Counts the total number of participants in all meetings.
 
         Returns:
-            int: seconds from 1970.
+            int: The total number of participants.
         """
-        dt = self.__date.split('.')
-        day = int(dt[0])
-        month = int(dt[1])
-        year = int(dt[2])
-        Date.leap_year(year)
-        sec_day = 86400
-        sec = (day - 1) * sec_day
-        for i in range(1, month):
-            sec += Date.days[i] * sec_day
-        for j in range(1970, year):
-            Date.leap_year(j)
-            for i in range(1, 13):
-                sec += Date.days[i] * sec_day
-        return sec
+        return self.participants
 
-    def __eq__(self, other):
+    def participants_on(self, date):
         """
-        Check equality between two Date objects.
+        Counts the number of participants of the meetings on a given date.
 
         Args:
-            other (Date): The Date object to compare with.
+            date (Date): The date of the meetings.
 
         Returns:
-            bool: True if the Date objects are equal, False otherwise.
+            int: The number of participants.
         """
-        return Date.to_timestamp(self) == Date.to_timestamp(other)
+        return self.participants_by_date.get(date.ordinal, 0)
 
-    def __ne__(self, other):
+    def check(self):
         """
-        Check inequality between two Date objects.
+        Recomputes the aggregates from scratch and compares them with the running ones.
+
+        The aggregates only see changes made through link and unlink (or Meeting.add_person
+        and Meeting.remove_person), not direct edits of Meeting.employees.
+
+        Returns:
+            bool: True if the running aggregates are consistent.
+        """
+        by_date = {}
+        for meeting in self.meetings:
+            if meeting.employees:
+                ordinal = meeting.date.ordinal
+                by_date[ordinal] = by_date.get(ordinal, 0) + len(meeting.employees)
+        running = {ordinal: count for ordinal, count in self.participants_by_date.items() if count}
+        return self.participants == sum(by_date.values()) and running == by_date
+
+
+class SqliteStore:
+    """
+    Represents a persistent store of meetings, users and memberships in an SQLite database.
+
+    The store has the same loading, adding and counting methods as MeetingStore, so it can be set
+    with Meeting.use_store, and a bulk import path that loads whole files in one transaction.
+
+    Both stores follow the same rules. A user attends a meeting at most once, so a repeated membership
+    is counted in the join report but not stored again. The first meeting or user stored for an id wins,
+    and a later row with the same id is reported in the duplicates of the join report. Unlike MeetingStore,
+    which keeps such a meeting as its own object, the database keys rows by id, so memberships of a
+    clashing row are skipped and a row equal to the stored one is the same meeting or user. Importing
+    the same files again therefore does not change the counts.
+    Every statement runs under a lock, so the store can be shared between threads.
+
+    Attributes:
+        path (str): The path to the database file, ':memory:' for an in-memory database.
+        connection (Connection): The connection to the database.
+        meetings (list): The Meeting objects added through add_meeting.
+        users (list): The User objects added through add_user.
+        users_by_id (dict): The first User object added through add_user for every id.
+        duplicate_meetings (set): The meeting ids added again with a different row.
+        duplicate_users (set): The user ids added again with a different row.
+        last_join (JoinReport): The result of the latest import.
+
+    Methods:
+        __init__: Opens the database and creates the tables and indexes.
+        load: Imports meetings, users and memberships from files, like MeetingStore.load.
+        import_files: Imports meetings, users and memberships from files in one transaction.
+        import_lines: Imports meetings, users and memberships from the lines of the files.
+        import_store: Imports all meetings, users and memberships of a MeetingStore.
+        add_meeting: Inserts a meeting.
+        add_user: Inserts a user.
+        link: Inserts a membership.
+        unlink: Deletes a membership.
+        count_meeting: Counts the number of meetings on a given date.
+        count_between: Counts the number of meetings between two dates.
+        total: Counts the total number of participants in all meetings.
+        roster: Returns the participants of a meeting.
+        meetings_of: Returns the meetings a user attends.
+        close: Closes the database.
+    """
+
+    def __init__(self, path=':memory:'):
+        """
+        Opens the database and creates the tables and indexes.
 
         Args:
-            other (Date): The Date object to compare with.
+            path (str, optional): The path to the database file. Defaults to ':memory:'.
+        """
+        self.path = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.meetings = []
+        self.users = []
+        self.users_by_id = {}
+        self.duplicate_meetings = set()
+        self.duplicate_users = set()
+        self.last_join = None
+        self.__lock = threading.RLock()
+        with self.connection:
+            self.connection.executescript('''
+                CREATE TABLE IF NOT EXISTS meetings (
+                    id INTEGER PRIMARY KEY, day INTEGER, date TEXT, title TEXT);
+                CREATE TABLE IF NOT EXISTS users (
+                    id INTEGER PRIMARY KEY, nick_name TEXT, first_name TEXT,
+                    last_name TEXT, middle_name TEXT, gender TEXT);
+                CREATE TABLE IF NOT EXISTS memberships (meeting_id INTEGER, user_id INTEGER);
+                CREATE INDEX IF NOT EXISTS meetings_day ON meetings (day);
+                CREATE UNIQUE INDEX IF NOT EXISTS memberships_pair ON memberships (meeting_id, user_id);
+                CREATE INDEX IF NOT EXISTS memberships_user ON memberships (user_id, meeting_id);
+                CREATE TEMP TABLE IF NOT EXISTS import_ids (id INTEGER PRIMARY KEY);
+            ''')
+
+    def load(self, file_meet, file_empl, file_pers):
+        """
+        Imports meetings, users and memberships from files, like MeetingStore.load.
+
+        The rows are only stored in the database, no Meeting or User objects are created.
+        The join result is kept in last_join.
+
+        Args:
+            file_meet (str): The path to the file containing meeting data.
+            file_empl (str): The path to the file containing employee data.
+            file_pers (str): The path to the file containing employee and meeting data.
 
         Returns:
-            bool: True if the Date objects are not equal, False otherwise.
+            list: An empty list, as there are no new Meeting objects.
         """
-        return Date.to_timestamp(self) != Date.to_timestamp(other)
+        self.import_files(file_meet, file_empl, file_pers)
+        return []
 
-    def __lt__(self, other):
+    def import_files(self, file_meet, file_empl, file_pers):
         """
-        Check if one Date object is less than another.
+        Imports meetings, users and memberships from files in one transaction.
 
         Args:
-            other (Date): The Date object to compare with.
+            file_meet (str): The path to the file containing meeting data.
+            file_empl (str): The path to the file containing employee data.
+            file_pers (str): The path to the file containing employee and meeting data.
 
         Returns:
-            bool: True if the first Date object is less than the second, False otherwise.
+            JoinReport: The numbers of imported, repeated and skipped memberships and the clashing ids.
         """
-        return Date.to_timestamp(self) < Date.to_timestamp(other)
+        with open(file_meet, encoding='utf-8') as f_1:
+            meets = f_1.readlines()
+        with open(file_empl, encoding='utf-8') as f_2:
+            users = f_2.readlines()
+        with open(file_pers, encoding='utf-8') as f_3:
+            meet_pers = f_3.readlines()
+        return self.import_lines(meets, users, meet_pers)
 
-    def __le__(self, other):
+    def import_lines(self, meets, users, meet_pers):
         """
-        Check if one Date object is less than or equal to another.
+        Imports meetings, users and memberships from the lines of the files, headers included.
+
+        The lines are parsed like in MeetingStore.load_lines, and memberships are linked by the ids
+        of these lines only.
 
         Args:
-            other (Date): The Date object to compare with.
+            meets (list): The lines of the file containing meeting data.
+            users (list): The lines of the file containing employee data.
+            meet_pers (list): The lines of the file containing employee and meeting data.
 
         Returns:
-            bool: True if the first Date object is less than or equal to the second, False otherwise.
+            JoinReport: The numbers of imported, repeated and skipped memberships and the clashing ids.
         """
-        return Date.to_timestamp(self) <= Date.to_timestamp(other)
+        meeting_rows, user_rows, pairs = MeetingStore.parse_lines(meets, users, meet_pers)
+        meeting_rows = [(id_meet, Date.parse(date), date, title) for id_meet, date, title in meeting_rows]
+        user_rows = [row + ('',) * (6 - len(row)) for row in user_rows]
+        return self.__import(meeting_rows, user_rows, pairs)
 
-    def __gt__(self, other):
+    def import_store(self, store):
         """
-        Check if one Date object is greater than another.
+        Imports all meetings, users and memberships of a MeetingStore in one transaction.
 
         Args:
-            other (Date): The Date object to compare with.
+            store (MeetingStore): The store to import.
 
         Returns:
-            bool: True if the first Date object is greater than the second, False otherwise.
+            JoinReport: The numbers of imported, repeated and skipped memberships and the clashing ids.
         """
-        return Date.to_timestamp(self) > Date.to_timestamp(other)
+        meeting_rows = [(meeting.id, meeting.date.ordinal, str(meeting.date), meeting.title)
+                        for meeting in store.meetings]
+        user_rows = [(user.id, user.nick_name, user.first_name, user.last_name, user.middle_name, user.gender)
+                     for user in store.users]
+        pairs = [(meeting.id, user.id) for meeting in store.meetings for user in meeting.employees]
+        return self.__import(meeting_rows, user_rows, pairs)
+
+    def __stored(self, table, ids):
+        """
+        Reads the stored rows of a table for some ids through a temporary table.
+
+        Args:
+            table (str): The table, 'meetings' or 'users'.
+            ids (iterable): The ids.
+
+        Returns:
+            dict: The stored row for every id that is already in the table.
+        """
+        self.connection.execute('DELETE FROM temp.import_ids')
+        self.connection.executemany('INSERT INTO temp.import_ids VALUES (?)', ((ind,) for ind in ids))
+        rows = self.connection.execute(f'SELECT {table}.* FROM {table} JOIN temp.import_ids USING (id)')
+        return {row[0]: row for row in rows}
 
-    def __ge__(self, other):
+    def __new_rows(self, table, rows, duplicates):
         """
-         Check if one Date object is greater than or equal to another.
+        Picks the rows to insert, keeping the first row for every id.
 
         Args:
-            other (Date): The Date object to compare with.
+            table (str): The table, 'meetings' or 'users'.
+            rows (list): The rows, with the id first.
+            duplicates (set): Collects the ids repeated within the rows or clashing with a different stored row.
 
         Returns:
-            bool: True if the first Date object is greater than or equal to the second, False otherwise.
+            tuple: The rows to insert, the first row for every id and the ids whose rows could not be stored.
         """
-        return Date.to_timestamp(self) >= Date.to_timestamp(other)
+        first = {}
+        for row in rows:
+            if row[0] in first:
+                if row != first[row[0]]:
+                    duplicates.add(row[0])
+            else:
+                first[row[0]] = row
+        stored = self.__stored(table, first)
+        clashed = {ind for ind, row in stored.items() if row != first[ind]}
+        duplicates |= clashed
+        return [row for ind, row in first.items() if ind not in stored], first, clashed
 
-    def __str__(self):
+    def __import(self, meeting_rows, user_rows, pairs):
         """
-        Return a string representation of the Date object.
+        Inserts prepared rows in one transaction with executemany.
+
+        Args:
+            meeting_rows (list): The (id, day, date, title) rows.
+            user_rows (list): The (id, nick_name, first_name, last_name, middle_name, gender) rows.
+            pairs (list): The (meeting id, user id) pairs.
 
         Returns:
-            str: The string representation of the Date object.
+            JoinReport: The numbers of imported, repeated and skipped memberships and the clashing ids.
         """
-        if self.__date is None:
-            return 'None'
-        return self.__date
+        report = JoinReport()
+        with self.__lock, self.connection:
+            new_meetings, meetings, clashed_meetings = self.__new_rows('meetings', meeting_rows,
+                                                                       report.duplicate_meetings)
+            new_users, users, clashed_users = self.__new_rows('users', user_rows, report.duplicate_users)
+            self.connection.executemany('INSERT INTO meetings VALUES (?, ?, ?, ?)', new_meetings)
+            self.connection.executemany('INSERT INTO users VALUES (?, ?, ?, ?, ?, ?)', new_users)
+            links = []
+            for id_meet, id_pers in pairs:
+                if id_meet not in meetings or id_pers not in users:
+                    report.skip(id_meet if id_meet not in meetings else None,
+                                id_pers if id_pers not in users else None)
+                elif id_meet in clashed_meetings or id_pers in clashed_users:
+                    report.skipped += 1
+                else:
+                    links.append((id_meet, id_pers))
+            before = self.total()
+            self.connection.executemany('INSERT OR IGNORE INTO memberships VALUES (?, ?)', links)
+            report.linked = self.total() - before
+            report.repeated = len(links) - report.linked
+        self.duplicate_meetings |= report.duplicate_meetings
+        self.duplicate_users |= report.duplicate_users
+        self.last_join = report
+        return report
+
+    def __insert(self, table, row, duplicates):
+        """
+        Inserts one row unless its id is stored, recording a clash with a different stored row.
 
-    def __repr__(self):
+        Args:
+            table (str): The table, 'meetings' or 'users'.
+            row (tuple): The row, with the id first.
+            duplicates (set): Collects the id if it clashes with a different stored row.
+        """
+        with self.__lock, self.connection:
+            stored = self.connection.execute(f'SELECT * FROM {table} WHERE id = ?', (row[0],)).fetchone()
+            if stored is None:
+                self.connection.execute(f'INSERT INTO {table} VALUES ({", ".join("?" * len(row))})', row)
+            elif stored != row:
+                duplicates.add(row[0])
+
+    def add_meeting(self, meeting):
+        """
+        Inserts a meeting, keeping the stored row for an already stored id.
+
+        Args:
+            meeting (Meeting): The meeting to insert.
+        """
+        self.meetings.append(meeting)
+        self.__insert('meetings', (meeting.id, meeting.date.ordinal, str(meeting.date), meeting.title),
+                      self.duplicate_meetings)
+
+    def add_user(self, user):
+        """
+        Inserts a user, keeping the stored row for an already stored id.
+
+        Args:
+            user (User): The user to insert.
+        """
+        self.users.append(user)
+        if user.id in self.users_by_id:
+            self.duplicate_users.add(user.id)
+        else:
+            self.users_by_id[user.id] = user
+        self.__insert('users', (user.id, user.nick_name, user.first_name, user.last_name,
+                                user.middle_name, user.gender), self.duplicate_users)
+
+    def link(self, meeting, user):
         """
-        Return a string representation of the Date object.
+        Inserts a membership, unless the user already attends the meeting.
+
+        Args:
+            meeting (Meeting): The meeting.
+            user (User): The participant.
 
         Returns:
-            str: The string representation of the Date object.
+            bool: True if the membership is new.
         """
-        if self.__date is None:
-            return 'None'
-        return self.__date
+        if user in meeting.employees:
+            return False
+        meeting.employees.append(user)
+        with self.__lock, self.connection:
+            self.connection.execute('INSERT OR IGNORE INTO memberships VALUES (?, ?)', (meeting.id, user.id))
+        return True
+
+    def unlink(self, meeting, user):
+        """
+        Deletes a membership.
+
+        Args:
+            meeting (Meeting): The meeting.
+            user (User): The participant.
+        """
+        meeting.employees.remove(user)
+        with self.__lock, self.connection:
+            self.connection.execute('DELETE FROM memberships WHERE meeting_id = ? AND user_id = ?',
+                                    (meeting.id, user.id))
+
+    def __query(self, sql, parameters=()):
+        """
+        Runs a read query under the lock.
+
+        Args:
+            sql (str): The query.
+            parameters (tuple, optional): The query parameters. Defaults to ().
+
+        Returns:
+            list: The result rows.
+        """
+        with self.__lock:
+            return self.connection.execute(sql, parameters).fetchall()
+
+    def count_meeting(self, date):
+        """
+        Counts the number of meetings on a given date.
+
+        Args:
+            date (Date): The date of the meetings to count.
+
+        Returns:
+            int: The number of meetings on the given date.
+        """
+        return self.__query('SELECT COUNT(*) FROM meetings WHERE day = ?', (date.ordinal,))[0][0]
+
+    def count_between(self, start, end):
+        """
+        Counts the number of meetings between two dates, both included.
+
+        Args:
+            start (Date): The first date.
+            end (Date): The last date.
+
+        Returns:
+            int: The number of meetings between the dates.
+        """
+        return self.__query('SELECT COUNT(*) FROM meetings WHERE day BETWEEN ? AND ?',
+                            (start.ordinal, end.ordinal))[0][0]
+
+    def total(self):
+        """
+        Counts the total number of participants in all meetings.
+
+        Returns:
+            int: The total number of participants.
+        """
+        return self.__query('SELECT COUNT(*) FROM memberships')[0][0]
+
+    def roster(self, meeting):
+        """
+        Returns the participants of a meeting.
+
+        Args:
+            meeting (Meeting or int): The meeting or the meeting id.
+
+        Returns:
+            list: The (id, nick_name, first_name, last_name, middle_name, gender) rows in membership order.
+        """
+        return self.__query(
+            'SELECT users.* FROM memberships JOIN users ON users.id = memberships.user_id '
+            'WHERE memberships.meeting_id = ? ORDER BY memberships.rowid',
+            (getattr(meeting, 'id', meeting),))
+
+    def meetings_of(self, user):
+        """
+        Returns the meetings a user attends.
+
+        Args:
+            user (User or int): The user or the user id.
+
+        Returns:
+            list: The (id, date, title) rows sorted by date and id.
+        """
+        return self.__query(
+            'SELECT meetings.id, meetings.date, meetings.title FROM memberships '
+            'JOIN meetings ON meetings.id = memberships.meeting_id '
+            'WHERE memberships.user_id = ? ORDER BY meetings.day, meetings.id',
+            (getattr(user, 'id', user),))
+
+    def close(self):
+        """
+        Closes the database.
+        """
+        with self.__lock:
+            self.connection.close()
+
+
+class JoinReport:
+    """
+    Represents the result of linking memberships by ids.
+
+    Attributes:
+        linked (int): The number of linked pairs.
+        repeated (int): The number of pairs whose user already attends the meeting.
+        skipped (int): The number of pairs with an unknown or clashing meeting or user id.
+        unknown_meetings (set): The unknown meeting ids.
+        unknown_users (set): The unknown user ids.
+        duplicate_meetings (set): The loaded meeting ids that were already taken in the group or the store.
+        duplicate_users (set): The loaded user ids that were already taken by another user.
+
+    Methods:
+        __init__: Initializes an empty JoinReport object.
+        skip: Records a pair with an unknown id.
+        __str__: Returns a short summary of the report.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty JoinReport object.
+        """
+        self.linked = 0
+        self.repeated = 0
+        self.skipped = 0
+        self.unknown_meetings = set()
+        self.unknown_users = set()
+        self.duplicate_meetings = set()
+        self.duplicate_users = set()
+
+    def skip(self, id_meet, id_pers):
+        """
+        Records a pair with an unknown id.
+
+        Args:
+            id_meet (int): The unknown meeting id, None if the meeting is known.
+            id_pers (int): The unknown user id, None if the user is known.
+        """
+        self.skipped += 1
+        if id_meet is not None:
+            self.unknown_meetings.add(id_meet)
+        if id_pers is not None:
+            self.unknown_users.add(id_pers)
+
+    def __str__(self):
+        """
+        Returns a short summary of the report.
+
+        Returns:
+            str: The numbers of linked, repeated and skipped pairs, unknown ids and duplicate ids.
+        """
+        return (f'linked: {self.linked} repeated: {self.repeated} skipped: {self.skipped} '
+                f'unknown meetings: {len(self.unknown_meetings)} unknown users: {len(self.unknown_users)} '
+                f'duplicate meetings: {len(self.duplicate_meetings)} duplicate users: {len(self.duplicate_users)}')
 
 
 class Meeting:
@@ -240,41 +894,119 @@ class Meeting:
     Represents a meeting and provides methods for managing meetings and participants.
 
     Attributes:
-        lst_meeting (list): A list containing all Meeting objects.
+        store (MeetingStore): The default store meetings and users are created in. It can be replaced
+            with a SqliteStore through use_store to run count_meeting, count_between and total as SQL queries.
+        lst_meeting (list): A list containing all Meeting objects of the default store.
 
     Methods:
         __init__: Initializes a Meeting object with information from a given string.
+        use_store: Class method to replace the default store.
+        from_row: Class method to create a Meeting object from already split values.
+        split: Static method to split a meeting string into its id, date and title.
         add_person: Adds a participant to the meeting.
+        remove_person: Removes a participant from the meeting.
         count: Returns the number of participants in the meeting.
         count_meeting: Class method to count the number of meetings on a given date.
+        count_between: Class method to count the number of meetings between two dates.
         total: Class method to count the total number of participants in all meetings.
         __str__: Returns a formatted string representation of the Meeting object.
     """
-    lst_meeting = []
+    store = MeetingStore()
+    lst_meeting = store.meetings
 
-    def __init__(self, info):
+    def __init__(self, info, store=None):
         """
          Initializes a Meeting object with information from a given string.
 
         Args:
             info (str): A string containing meeting information separated by ';'.
+            store (MeetingStore, optional): The store to add the meeting to. Defaults to Meeting.store.
+        """
+        self.__setup(Meeting.split(info), store)
+
+    @classmethod
+    def use_store(cls, store):
+        """
+        Replace the default store of meetings and users.
+
+        Meeting.lst_meeting and User.users are pointed at the lists of the new store.
+
+        Args:
+            store (MeetingStore or SqliteStore): The new default store.
+        """
+        Meeting.store = store
+        Meeting.lst_meeting = store.meetings
+        User.users = store.users
+
+    @classmethod
+    def from_row(cls, values, store=None):
+        """
+        Create a Meeting object from already split values.
+
+        Args:
+            values (tuple): The id, date string and title of the meeting.
+            store (MeetingStore, optional): The store to add the meeting to. Defaults to Meeting.store.
+
+        Returns:
+            Meeting: The new Meeting object.
+        """
+        meeting = cls.__new__(cls)
+        meeting.__setup(values, store)
+        return meeting
+
+    @staticmethod
+    def split(info):
+        """
+        Split a meeting string into its id, date and title.
+
+        Args:
+            info (str): A string containing meeting information separated by ';'.
+
+        Returns:
+            tuple: The id, date string and title of the meeting.
         """
         meet_info = info.split(';')
-        self.id = int(meet_info[0])
-        self.date = Date(meet_info[1])
-        self.title = meet_info[2]
+        return int(meet_info[0]), meet_info[1], meet_info[2]
+
+    def __setup(self, values, store):
+        """
+        Sets the fields of the meeting and adds it to a store.
+
+        Args:
+            values (tuple): The id, date string and title of the meeting.
+            store (MeetingStore): The store to add the meeting to, None for Meeting.store.
+        """
+        if store is None:
+            store = Meeting.store
+        self.id = values[0]
+        self.date = Date(values[1])
+        self.title = values[2]
         self.employees = []
-        Meeting.lst_meeting.append(self)
+        self.store = store
+        store.add_meeting(self)
 
     def add_person(self, person):
         """
-        Adds a participant to the meeting.
+        Adds a participant to the meeting. A user who already attends the meeting is not added again.
+
+        Args:
+            person (str, int or User): A string containing information about the participant separated by ';',
+                the id of a user already in the store, or a User object.
+        """
+        if isinstance(person, str):
+            person = User.get(*User.split(person), store=self.store)
+        elif not isinstance(person, User):
+            person = self.store.users_by_id[int(person)]
+        self.store.link(self, person)
+
+    def remove_person(self, person):
+        """
+        Removes a participant from the meeting.
 
         Args:
-            person (str): A string containing information about the participant separated by ';'.
+            person (User): The participant to remove.
         """
-        person = User(*person.split(';'))
-        self.employees.append(person)
+        self.store.unlink(self, person)
 
     def count(self):
         """
@@ -296,11 +1028,21 @@ class Meeting:
         Returns:
             int: The number of meetings on the given date.
         """
-        count = 0
-        for i in range(len(Meeting.lst_meeting)):
-            if date == Meeting.lst_meeting[i].date:
-                count += 1
-        return count
+        return Meeting.store.count_meeting(date)
+
+    @classmethod
+    def count_between(cls, start, end):
+        """
+        Counts the number of meetings between two dates, both included.
+
+        Args:
+            start (Date): The first date.
+            end (Date): The last date.
+
+        Returns:
+            int: The number of meetings between the dates.
+        """
+        return Meeting.store.count_between(start, end)
 
     @classmethod
     def total(cls):
@@ -310,10 +1052,7 @@ class Meeting:
         Returns:
             int: The total number of participants.
         """
-        count = 0
-        for i in range(len(Meeting.lst_meeting)):
-            count += Meeting.lst_meeting[i].count()
-        return count
+        return Meeting.store.total()
 
     def __str__(self):
         """
@@ -331,17 +1070,24 @@ class User:
     """
     Represents a user and provides methods for managing user information.
 
+    Users are meant to be created through User.get, which returns the already registered
+    user with the same id and fields instead of a new object. Name fields are interned, so repeating
+    names share one string.
+
     Attributes:
-        users (list): A list containing all User objects.
+        users (list): A list containing all User objects of the default store.
 
     Methods:
         __init__: Initializes a User object with information from a given string.
+        get: Class method to return the registered user with a given id and fields or create it.
+        split: Static method to split a user string into its fields.
         __str__: Returns a formatted string representation of the User object.
         __repr__: Returns a string representation of the User object.
     """
-    users = []
+    __slots__ = ('id', 'nick_name', 'first_name', 'last_name', 'middle_name', 'gender')
+    users = Meeting.store.users
 
-    def __init__(self, id, nick_name, first_name, last_name='', middle_name='', gender=''):
+    def __init__(self, id, nick_name, first_name, last_name='', middle_name='', gender='', *, store=None):
         """
         Initializes a User object with information from a given string.
 
@@ -352,15 +1098,64 @@ class User:
             last_name (str, optional): The user's last name. Defaults to ''.
             middle_name (str, optional): The user's middle name. Defaults to ''.
             gender (str, optional): The user's gender. Defaults to ''.
+            store (MeetingStore, optional): The store to add the user to. Defaults to Meeting.store.
         """
+        if store is None:
+            store = Meeting.store
         self.id = int(id)
-        self.nick_name = nick_name
-        self.first_name = first_name
-        self.last_name = last_name
-        self.middle_name = middle_name
-        self.gender = gender
+        self.nick_name = sys.intern(nick_name)
+        self.first_name = sys.intern(first_name)
+        self.last_name = sys.intern(last_name)
+        self.middle_name = sys.intern(middle_name)
+        self.gender = sys.intern(gender)
 
-        User.users.append(self)
+        store.add_user(self)
+
+    @classmethod
+    def get(cls, id, *fields, store=None):
+        """
+        Returns the registered user with a given id and fields or creates it.
+
+        The given fields are compared with the registered user. If they differ, a new user is
+        created and the store records the id in duplicate_users. An id without fields returns
+        the registered user as it is.
+
+        Args:
+            id (str or int): The user ID.
+            *fields (str): The nickname, first name, last name, middle name and gender for a new user.
+            store (MeetingStore, optional): The store to look the user up in. Defaults to Meeting.store.
+
+        Returns:
+            User: The registered or new User object.
+        """
+        if store is None:
+            store = Meeting.store
+        user = store.users_by_id.get(int(id))
+        if user is not None:
+            if not fields:
+                return user
+            current = (user.nick_name, user.first_name, user.last_name, user.middle_name, user.gender)
+            if current == fields + ('',) * (5 - len(fields)):
+                return user
+        return cls(id, *fields, store=store)
+
+    @staticmethod
+    def split(info):
+        """
+        Split a user string into its fields.
+
+        The line break and the empty field after a trailing ';' are dropped.
+
+        Args:
+            info (str): A string containing user information separated by ';'.
+
+        Returns:
+            list: The id, nickname, first name and the optional fields.
+        """
+        inf = info.rstrip('\r\n').split(';')
+        if len(inf) == 7 and inf[-1] == '':
+            inf.pop()
+        return inf
 
     def __str__(self):
         """
@@ -407,22 +1202,122 @@ class Load:
             file_empl (str): The path to the file containing employee data.
             file_pers (str): The path to the file containing employee and meeting data.
         """
-        with open(file_meet, encoding='utf-8') as f_1:
-            meets = f_1.readlines()
-            for n in range(1, len(meets)):
-                mt = Meeting(meets[n])
-                Load.meetings.append(mt)
+        Load.meetings.extend(Meeting.store.load(file_meet, file_empl, file_pers))
 
-        with open(file_empl, encoding='utf-8') as f_2:
-            users = f_2.readlines()
-            for n in range(1, len(users)):
-                inf = users[n].split(';')
-                if inf[-1] == '\n' or len(inf) > 6:
-                    inf = inf[:-1]
-                User(*inf)
 
-        with open(file_pers, encoding='utf-8') as f_3:
-            meet_pers = f_3.readlines()
-            for n in range(1, len(meet_pers)):
-                pers = meet_pers[n].split(';')
-                Load.meetings[int(pers[0]) - 1].employees.append(User.users[int(pers[1]) - 1])
+class LoadSession:
+    """
+    Represents a loader session that owns its own MeetingStore instead of the class-level lists.
+
+    Independent sessions share no state and can load in parallel threads. Loads into one
+    session from several threads are serialized by a lock. Dropping or closing the session
+    releases all its meetings and users at once.
+
+    Attributes:
+        store (MeetingStore): The store of the session.
+
+    Methods:
+        __init__: Initializes an empty LoadSession object.
+        write: Reads data from files into the session.
+        write_many: Reads many groups of files in a thread pool.
+        write_async: Reads many groups of files concurrently with asyncio.
+        close: Releases all meetings and users of the session.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty LoadSession object.
+        """
+        self.store = MeetingStore()
+        self.__lock = threading.Lock()
+
+    def write(self, file_meet, file_empl, file_pers):
+        """
+        Reads data from files into the session.
+
+        Args:
+            file_meet (str): The path to the file containing meeting data.
+            file_empl (str): The path to the file containing employee data.
+            file_pers (str): The path to the file containing employee and meeting data.
+
+        Returns:
+            list: The new Meeting objects.
+        """
+        with self.__lock:
+            return self.store.load(file_meet, file_empl, file_pers)
+
+    def write_many(self, groups, workers=None):
+        """
+        Reads many groups of files in a thread pool.
+
+        Args:
+            groups (iterable): The (file_meet, file_empl, file_pers) tuples.
+            workers (int, optional): The number of threads. Defaults to the ThreadPoolExecutor default.
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda group: self.write(*group), groups))
+
+    async def write_async(self, groups, concurrency=16):
+        """
+        Reads many groups of files concurrently with asyncio.
+
+        The files are read in the default executor, at most concurrency groups at a time.
+        Every group is parsed completely and then merged into the session one group at a time,
+        so a failing group is reported, leaves nothing in the store and does not stop the others.
+        The time of a group does not include waiting for the semaphore.
+
+        Args:
+            groups (iterable): The (file_meet, file_empl, file_pers) tuples.
+            concurrency (int, optional): The maximum number of groups read at once. Defaults to 16.
+
+        Returns:
+            list: A FileResult with the group, seconds, number of meetings and error for every group.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        def read(files):
+            lines = []
+            for file in files:
+                with open(file, encoding='utf-8') as f:
+                    lines.append(f.readlines())
+            return lines
+
+        async def load(group):
+            async with semaphore:
+                start = time.perf_counter()
+                try:
+                    lines = await loop.run_in_executor(None, read, group)
+                    parsed = MeetingStore.parse_lines(*lines)
+                    with self.__lock:
+                        meetings = self.store.merge(*parsed)
+                except (OSError, ValueError, IndexError, TypeError) as error:
+                    return FileResult(group, time.perf_counter() - start, 0, error)
+                return FileResult(group, time.perf_counter() - start, len(meetings), None)
+
+        return await asyncio.gather(*(load(tuple(group)) for group in groups))
+
+    def close(self):
+        """
+        Releases all meetings and users of the session.
+        """
+        with self.__lock:
+            self.store = MeetingStore()
+
+    def __enter__(self):
+        """
+        Enters the context of the LoadSession.
+
+        Returns:
+            LoadSession: The LoadSession object itself.
+        """
+        return self
+
+    def __exit__(self, *exc):
+        """
+        Closes the session when leaving the context.
+
+        Args:
+            *exc: The exception type, value and traceback, if any.
+        """
+        self.close()